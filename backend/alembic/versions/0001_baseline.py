@@ -0,0 +1,168 @@
+"""Baseline schema
+
+Recreates the schema exactly as create_tables() built it before migrations
+were introduced. Databases that already have these tables should be marked
+with `alembic stamp 0001` instead of running this revision.
+
+Revision ID: 0001
+Revises:
+Create Date: 2024-01-01 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    user_role = sa.Enum("ADMIN", "MANAGER", "VIEWER", name="userrole")
+    asset_status = sa.Enum(
+        "AVAILABLE", "PENDING_FOR_SIGNATURE", "IN_USE", "MAINTENANCE", "RETIRED",
+        name="assetstatus",
+    )
+    document_type = sa.Enum(
+        "DECLARATION_FORM", "IT_ORIENTATION", "HANDOVER_FORM", name="documenttype"
+    )
+    document_status = sa.Enum(
+        "PENDING", "SIGNED", "EXPIRED", "CANCELLED", name="documentstatus"
+    )
+
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("username", sa.String(50), nullable=False),
+        sa.Column("email", sa.String(100), nullable=False),
+        sa.Column("full_name", sa.String(100), nullable=False),
+        sa.Column("department", sa.String(50), nullable=False),
+        sa.Column("role", user_role),
+        sa.Column("hashed_password", sa.String(255), nullable=False),
+        sa.Column("is_active", sa.Boolean()),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("updated_at", sa.DateTime()),
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_username", "users", ["username"], unique=True)
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "assets",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("asset_id", sa.String(50), nullable=False),
+        sa.Column("asset_tag", sa.String(100)),
+        sa.Column("type", sa.String(50), nullable=False),
+        sa.Column("brand", sa.String(100), nullable=False),
+        sa.Column("model", sa.String(100), nullable=False),
+        sa.Column("serial_number", sa.String(100), unique=True),
+        sa.Column("department", sa.String(50), nullable=False),
+        sa.Column("location", sa.String(100)),
+        sa.Column("purchase_date", sa.DateTime(), nullable=False),
+        sa.Column("warranty_expiry", sa.DateTime(), nullable=False),
+        sa.Column("purchase_cost", sa.String(20)),
+        sa.Column("condition", sa.String(50)),
+        sa.Column("notes", sa.Text()),
+        sa.Column("status", asset_status),
+        sa.Column("os", sa.String(100)),
+        sa.Column("os_version", sa.String(50)),
+        sa.Column("assigned_user_id", sa.Integer(), sa.ForeignKey("users.id")),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("updated_at", sa.DateTime()),
+    )
+    op.create_index("ix_assets_id", "assets", ["id"])
+    op.create_index("ix_assets_asset_id", "assets", ["asset_id"], unique=True)
+    op.create_index("ix_assets_asset_tag", "assets", ["asset_tag"])
+
+    op.create_table(
+        "asset_issuances",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("asset_id", sa.Integer(), sa.ForeignKey("assets.id"), nullable=False),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("issued_date", sa.DateTime()),
+        sa.Column("expected_return_date", sa.DateTime()),
+        sa.Column("return_date", sa.DateTime()),
+        sa.Column("notes", sa.Text()),
+        sa.Column("issued_by", sa.String(100)),
+        sa.Column("created_at", sa.DateTime()),
+    )
+    op.create_index("ix_asset_issuances_id", "asset_issuances", ["id"])
+
+    op.create_table(
+        "notifications",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("type", sa.String(50), nullable=False),
+        sa.Column("title", sa.String(200), nullable=False),
+        sa.Column("message", sa.Text(), nullable=False),
+        sa.Column("asset_id", sa.Integer(), sa.ForeignKey("assets.id")),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id")),
+        sa.Column("is_read", sa.Boolean()),
+        sa.Column("created_at", sa.DateTime()),
+    )
+    op.create_index("ix_notifications_id", "notifications", ["id"])
+
+    op.create_table(
+        "audit_logs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("action", sa.String(100), nullable=False),
+        sa.Column("resource_type", sa.String(50), nullable=False),
+        sa.Column("resource_id", sa.String(50)),
+        sa.Column("resource_name", sa.String(200)),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("user_name", sa.String(100), nullable=False),
+        sa.Column("user_role", sa.String(20), nullable=False),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column("details", sa.Text()),
+        sa.Column("old_values", sa.Text()),
+        sa.Column("new_values", sa.Text()),
+        sa.Column("asset_id", sa.Integer(), sa.ForeignKey("assets.id")),
+        sa.Column("asset_identifier", sa.String(50)),
+        sa.Column("ip_address", sa.String(45)),
+        sa.Column("user_agent", sa.String(500)),
+        sa.Column("timestamp", sa.DateTime()),
+    )
+    op.create_index("ix_audit_logs_id", "audit_logs", ["id"])
+
+    op.create_table(
+        "asset_documents",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("asset_id", sa.Integer(), sa.ForeignKey("assets.id"), nullable=False),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("document_type", document_type, nullable=False),
+        sa.Column("status", document_status),
+        sa.Column("document_data", sa.Text()),
+        sa.Column("signature_data", sa.Text()),
+        sa.Column("ip_address", sa.String(45)),
+        sa.Column("user_agent", sa.String(500)),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("signed_at", sa.DateTime()),
+        sa.Column("expires_at", sa.DateTime()),
+    )
+    op.create_index("ix_asset_documents_id", "asset_documents", ["id"])
+
+    op.create_table(
+        "document_templates",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("document_type", document_type, unique=True, nullable=False),
+        sa.Column("template_name", sa.String(200), nullable=False),
+        sa.Column("template_content", sa.Text(), nullable=False),
+        sa.Column("fields_schema", sa.Text(), nullable=False),
+        sa.Column("is_active", sa.Boolean()),
+        sa.Column("version", sa.String(10)),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("updated_at", sa.DateTime()),
+    )
+    op.create_index("ix_document_templates_id", "document_templates", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_table("document_templates")
+    op.drop_table("asset_documents")
+    op.drop_table("audit_logs")
+    op.drop_table("notifications")
+    op.drop_table("asset_issuances")
+    op.drop_table("assets")
+    op.drop_table("users")
+    for enum_name in ("documentstatus", "documenttype", "assetstatus", "userrole"):
+        sa.Enum(name=enum_name).drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,46 @@
+"""Store asset status as a CHECK-constrained string
+
+Replaces the native assetstatus ENUM (which stored member names such as
+'IN_USE') with a VARCHAR holding the lowercase AssetStatus values, guarded by
+a CHECK constraint and backed by a plain btree index.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2024-01-02 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+STATUSES = ("available", "pending_for_signature", "in_use", "maintenance", "retired")
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "assets", "status",
+        type_=sa.String(24),
+        postgresql_using="lower(status::text)",
+    )
+    op.execute("DROP TYPE IF EXISTS assetstatus")
+    op.create_check_constraint(
+        "ck_assets_status", "assets",
+        "status IN ({})".format(", ".join(f"'{s}'" for s in STATUSES)),
+    )
+    op.create_index("ix_assets_status", "assets", ["status"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_assets_status", table_name="assets")
+    op.drop_constraint("ck_assets_status", "assets", type_="check")
+    asset_status = sa.Enum(*(s.upper() for s in STATUSES), name="assetstatus")
+    asset_status.create(op.get_bind())
+    op.alter_column(
+        "assets", "status",
+        type_=asset_status,
+        postgresql_using="upper(status)::assetstatus",
+    )
@@ -0,0 +1,30 @@
+"""Index the asset filter predicates
+
+Adds indexes for the status/department filters, the warranty expiry window
+and assigned-user lookups, and drops the redundant index on the primary key.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2024-01-03 00:00:00
+"""
+
+from alembic import op
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_asset_status_dept", "assets", ["status", "department"])
+    op.create_index("ix_asset_warranty", "assets", ["warranty_expiry"])
+    op.create_index("ix_asset_assigned", "assets", ["assigned_user_id"])
+    op.drop_index("ix_assets_id", table_name="assets")
+
+
+def downgrade() -> None:
+    op.create_index("ix_assets_id", "assets", ["id"])
+    op.drop_index("ix_asset_assigned", table_name="assets")
+    op.drop_index("ix_asset_warranty", table_name="assets")
+    op.drop_index("ix_asset_status_dept", table_name="assets")
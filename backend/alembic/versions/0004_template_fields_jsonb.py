@@ -0,0 +1,38 @@
+"""Store document template field schemas as JSONB
+
+fields_schema used to be JSON serialized into a Text column and parsed again
+on every read. Existing rows are converted in place with a ::jsonb cast.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2024-01-04 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "document_templates",
+        "fields_schema",
+        type_=postgresql.JSONB(),
+        existing_nullable=False,
+        postgresql_using="fields_schema::jsonb",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "document_templates",
+        "fields_schema",
+        type_=sa.Text(),
+        existing_nullable=False,
+        postgresql_using="fields_schema::text",
+    )
@@ -0,0 +1,40 @@
+"""Store user role and document enums by value
+
+The userrole, documenttype and documentstatus enum types held the Python
+member names ('ADMIN', 'SIGNED', ...). The columns now store member values
+('admin', 'signed', ...), matching assets.status and the API, so each label
+is renamed in place. Existing rows follow the rename automatically.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2024-01-05 00:00:00
+"""
+
+from alembic import op
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+ENUM_LABELS = {
+    "userrole": ("ADMIN", "MANAGER", "VIEWER"),
+    "documenttype": ("DECLARATION_FORM", "IT_ORIENTATION", "HANDOVER_FORM"),
+    "documentstatus": ("PENDING", "SIGNED", "EXPIRED", "CANCELLED"),
+}
+
+
+def upgrade() -> None:
+    for type_name, labels in ENUM_LABELS.items():
+        for label in labels:
+            op.execute(
+                f"ALTER TYPE {type_name} RENAME VALUE '{label}' TO '{label.lower()}'"
+            )
+
+
+def downgrade() -> None:
+    for type_name, labels in ENUM_LABELS.items():
+        for label in labels:
+            op.execute(
+                f"ALTER TYPE {type_name} RENAME VALUE '{label.lower()}' TO '{label}'"
+            )
@@ -0,0 +1,25 @@
+"""Index asset documents by user and status
+
+Backs the pending-document lookups, which filter on user_id and status.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2024-01-06 00:00:00
+"""
+
+from alembic import op
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_asset_documents_user_status", "asset_documents", ["user_id", "status"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_asset_documents_user_status", table_name="asset_documents")
@@ -0,0 +1,43 @@
+"""Index open issuances, audit resources and unread notifications
+
+Adds partial indexes over open asset issuances (return_date IS NULL) by asset
+and by user, a partial index over unread notifications per user, an index on
+the audit log resource key and an index on asset_documents.asset_id.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2024-01-07 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_issuance_asset_open", "asset_issuances", ["asset_id"],
+        postgresql_where=sa.text("return_date IS NULL"),
+    )
+    op.create_index(
+        "ix_issuance_user_open", "asset_issuances", ["user_id"],
+        postgresql_where=sa.text("return_date IS NULL"),
+    )
+    op.create_index(
+        "ix_notification_user_unread", "notifications", ["user_id"],
+        postgresql_where=sa.text("is_read = false"),
+    )
+    op.create_index("ix_audit_resource", "audit_logs", ["resource_type", "resource_id"])
+    op.create_index("ix_asset_documents_asset_id", "asset_documents", ["asset_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_asset_documents_asset_id", table_name="asset_documents")
+    op.drop_index("ix_audit_resource", table_name="audit_logs")
+    op.drop_index("ix_notification_user_unread", table_name="notifications")
+    op.drop_index("ix_issuance_user_open", table_name="asset_issuances")
+    op.drop_index("ix_issuance_asset_open", table_name="asset_issuances")
@@ -0,0 +1,44 @@
+"""Stamp timestamps in the database
+
+Timestamp columns used to be filled in by the application with
+datetime.utcnow(). They now default to the current UTC time on the server, so
+rows inserted outside the ORM (bulk inserts, SQL scripts) are stamped too.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2024-01-08 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+TIMESTAMP_COLUMNS = (
+    ("users", "created_at"),
+    ("users", "updated_at"),
+    ("assets", "created_at"),
+    ("assets", "updated_at"),
+    ("asset_issuances", "issued_date"),
+    ("asset_issuances", "created_at"),
+    ("notifications", "created_at"),
+    ("audit_logs", "timestamp"),
+    ("asset_documents", "created_at"),
+    ("document_templates", "created_at"),
+    ("document_templates", "updated_at"),
+)
+
+
+def upgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table, column, server_default=sa.text("timezone('utc', now())")
+        )
+
+
+def downgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=None)
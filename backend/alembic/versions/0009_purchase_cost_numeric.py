@@ -0,0 +1,44 @@
+"""Store purchase cost as a number
+
+assets.purchase_cost was a free-form VARCHAR(20), so every report had to
+parse it in Python. It is now NUMERIC(12, 2), which lets the database sum
+costs directly. Currency symbols and thousands separators are stripped from
+existing values during the conversion; empty values become NULL.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2024-01-09 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "assets",
+        "purchase_cost",
+        type_=sa.Numeric(12, 2),
+        existing_type=sa.String(20),
+        existing_nullable=True,
+        postgresql_using=(
+            "NULLIF(regexp_replace(purchase_cost, '[^0-9.-]', '', 'g'), '')"
+            "::numeric(12, 2)"
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "assets",
+        "purchase_cost",
+        type_=sa.String(20),
+        existing_type=sa.Numeric(12, 2),
+        existing_nullable=True,
+        postgresql_using="purchase_cost::varchar(20)",
+    )
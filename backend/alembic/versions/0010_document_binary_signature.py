@@ -0,0 +1,62 @@
+"""Store signatures as bytes and form data as JSONB
+
+asset_documents.signature_data held the Base64 data URL sent by the
+signature canvas; it now holds the decoded image bytes (BYTEA), a third
+smaller and never re-encoded on the server. asset_documents.document_data
+held form values serialized with json.dumps(); it is now JSONB.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2024-01-10 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "asset_documents",
+        "signature_data",
+        type_=sa.LargeBinary(),
+        existing_type=sa.Text(),
+        existing_nullable=True,
+        postgresql_using="decode(regexp_replace(signature_data, '^data:[^,]*,', ''), 'base64')",
+    )
+    op.alter_column(
+        "asset_documents",
+        "document_data",
+        type_=postgresql.JSONB(),
+        existing_type=sa.Text(),
+        existing_nullable=True,
+        postgresql_using="document_data::jsonb",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "asset_documents",
+        "document_data",
+        type_=sa.Text(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using="document_data::text",
+    )
+    # encode() wraps its output every 76 characters; the data URL must not
+    op.alter_column(
+        "asset_documents",
+        "signature_data",
+        type_=sa.Text(),
+        existing_type=sa.LargeBinary(),
+        existing_nullable=True,
+        postgresql_using=(
+            "'data:image/png;base64,' || "
+            "translate(encode(signature_data, 'base64'), E'\\n', '')"
+        ),
+    )
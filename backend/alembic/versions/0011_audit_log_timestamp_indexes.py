@@ -0,0 +1,39 @@
+"""Index the audit log by actor, resource and action with timestamp
+
+The audit log is always read newest first. Composite indexes ending in
+timestamp cover the per-user, per-resource and per-action views, the
+timestamp index covers the unfiltered recent activity feed, and asset_id is
+indexed for the foreign key. ix_audit_resource is replaced by
+ix_audit_resource_ts, which has the same leading columns.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2024-01-11 00:00:00
+"""
+
+from alembic import op
+
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_audit_user_ts", "audit_logs", ["user_id", "timestamp"])
+    op.create_index(
+        "ix_audit_resource_ts", "audit_logs", ["resource_type", "resource_id", "timestamp"]
+    )
+    op.create_index("ix_audit_action_ts", "audit_logs", ["action", "timestamp"])
+    op.create_index("ix_audit_logs_timestamp", "audit_logs", ["timestamp"])
+    op.create_index("ix_audit_logs_asset_id", "audit_logs", ["asset_id"])
+    op.drop_index("ix_audit_resource", table_name="audit_logs")
+
+
+def downgrade() -> None:
+    op.create_index("ix_audit_resource", "audit_logs", ["resource_type", "resource_id"])
+    op.drop_index("ix_audit_logs_asset_id", table_name="audit_logs")
+    op.drop_index("ix_audit_logs_timestamp", table_name="audit_logs")
+    op.drop_index("ix_audit_action_ts", table_name="audit_logs")
+    op.drop_index("ix_audit_resource_ts", table_name="audit_logs")
+    op.drop_index("ix_audit_user_ts", table_name="audit_logs")
@@ -0,0 +1,35 @@
+"""Index the remaining foreign key columns
+
+asset_issuances and notifications only had partial indexes over open
+issuances and unread notifications. Deleting an asset or a user, and reading
+an asset's full issuance history, scanned the whole child table. Their
+asset_id and user_id columns are now indexed in full.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2024-01-12 00:00:00
+"""
+
+from alembic import op
+
+revision = "0012"
+down_revision = "0011"
+branch_labels = None
+depends_on = None
+
+FOREIGN_KEY_COLUMNS = (
+    ("asset_issuances", "asset_id"),
+    ("asset_issuances", "user_id"),
+    ("notifications", "asset_id"),
+    ("notifications", "user_id"),
+)
+
+
+def upgrade() -> None:
+    for table, column in FOREIGN_KEY_COLUMNS:
+        op.create_index(f"ix_{table}_{column}", table, [column])
+
+
+def downgrade() -> None:
+    for table, column in reversed(FOREIGN_KEY_COLUMNS):
+        op.drop_index(f"ix_{table}_{column}", table_name=table)
@@ -0,0 +1,64 @@
+"""Widen the open issuance and unread notification indexes
+
+The partial indexes over open issuances and unread notifications gain the
+column their lookups sort or probe by: issued_date for the latest open
+issuance of an asset, asset_id for a user's current holdings and created_at
+for a user's inbox. A new partial index on issued_date serves the
+dashboard's most recent open issuances.
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2024-01-13 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0013"
+down_revision = "0012"
+branch_labels = None
+depends_on = None
+
+OPEN_ISSUANCE = sa.text("return_date IS NULL")
+UNREAD = sa.text("is_read = false")
+
+
+def upgrade() -> None:
+    op.drop_index("ix_issuance_asset_open", table_name="asset_issuances")
+    op.create_index(
+        "ix_issuance_asset_open", "asset_issuances", ["asset_id", "issued_date"],
+        postgresql_where=OPEN_ISSUANCE,
+    )
+    op.drop_index("ix_issuance_user_open", table_name="asset_issuances")
+    op.create_index(
+        "ix_issuance_user_open", "asset_issuances", ["user_id", "asset_id"],
+        postgresql_where=OPEN_ISSUANCE,
+    )
+    op.create_index(
+        "ix_issuance_open_issued", "asset_issuances", ["issued_date"],
+        postgresql_where=OPEN_ISSUANCE,
+    )
+    op.drop_index("ix_notification_user_unread", table_name="notifications")
+    op.create_index(
+        "ix_notification_user_unread", "notifications", ["user_id", "created_at"],
+        postgresql_where=UNREAD,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notification_user_unread", table_name="notifications")
+    op.create_index(
+        "ix_notification_user_unread", "notifications", ["user_id"],
+        postgresql_where=UNREAD,
+    )
+    op.drop_index("ix_issuance_open_issued", table_name="asset_issuances")
+    op.drop_index("ix_issuance_user_open", table_name="asset_issuances")
+    op.create_index(
+        "ix_issuance_user_open", "asset_issuances", ["user_id"],
+        postgresql_where=OPEN_ISSUANCE,
+    )
+    op.drop_index("ix_issuance_asset_open", table_name="asset_issuances")
+    op.create_index(
+        "ix_issuance_asset_open", "asset_issuances", ["asset_id"],
+        postgresql_where=OPEN_ISSUANCE,
+    )
@@ -0,0 +1,46 @@
+"""Store audit old/new values as JSONB
+
+audit_logs.old_values and audit_logs.new_values always held json.dumps()
+output in TEXT columns. They are now JSONB, so values are parsed once on
+insert and can be filtered on by the database. audit_logs.details stays
+TEXT: it holds free-form descriptions, not JSON.
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2024-01-14 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0014"
+down_revision = "0013"
+branch_labels = None
+depends_on = None
+
+VALUE_COLUMNS = ("old_values", "new_values")
+
+
+def upgrade() -> None:
+    for column in VALUE_COLUMNS:
+        op.alter_column(
+            "audit_logs",
+            column,
+            type_=postgresql.JSONB(),
+            existing_type=sa.Text(),
+            existing_nullable=True,
+            postgresql_using=f"{column}::jsonb",
+        )
+
+
+def downgrade() -> None:
+    for column in VALUE_COLUMNS:
+        op.alter_column(
+            "audit_logs",
+            column,
+            type_=sa.Text(),
+            existing_type=postgresql.JSONB(),
+            existing_nullable=True,
+            postgresql_using=f"{column}::text",
+        )
@@ -0,0 +1,31 @@
+"""Limit the warranty expiry index to assets that are not retired
+
+Warranty alerts are only raised for assets that are not retired, so
+ix_asset_warranty is replaced by ix_asset_warranty_soon, a partial index
+over warranty_expiry WHERE status <> 'retired'.
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2024-01-15 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0015"
+down_revision = "0014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_asset_warranty_soon", "assets", ["warranty_expiry"],
+        postgresql_where=sa.text("status <> 'retired'"),
+    )
+    op.drop_index("ix_asset_warranty", table_name="assets")
+
+
+def downgrade() -> None:
+    op.create_index("ix_asset_warranty", "assets", ["warranty_expiry"])
+    op.drop_index("ix_asset_warranty_soon", table_name="assets")
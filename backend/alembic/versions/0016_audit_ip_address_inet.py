@@ -0,0 +1,41 @@
+"""Store the audit log IP address as INET
+
+audit_logs.ip_address was VARCHAR(45), sized for the longest textual IPv6
+address. INET stores an address in at most 19 bytes and rejects values that
+are not addresses. Blank values become NULL.
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2024-01-16 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0016"
+down_revision = "0015"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "audit_logs",
+        "ip_address",
+        type_=postgresql.INET(),
+        existing_type=sa.String(45),
+        existing_nullable=True,
+        postgresql_using="NULLIF(trim(ip_address), '')::inet",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "audit_logs",
+        "ip_address",
+        type_=sa.String(45),
+        existing_type=postgresql.INET(),
+        existing_nullable=True,
+        postgresql_using="host(ip_address)",
+    )
@@ -0,0 +1,34 @@
+"""Add row versions to users, assets and asset issuances
+
+Each table gains a version column used by SQLAlchemy's version_id_col:
+updates are issued as UPDATE ... WHERE id = :id AND version = :version and
+increment it, so a concurrent change is detected instead of silently
+overwritten. Existing rows start at version 1.
+
+Revision ID: 0017
+Revises: 0016
+Create Date: 2024-01-17 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0017"
+down_revision = "0016"
+branch_labels = None
+depends_on = None
+
+VERSIONED_TABLES = ("users", "assets", "asset_issuances")
+
+
+def upgrade() -> None:
+    for table in VERSIONED_TABLES:
+        op.add_column(
+            table,
+            sa.Column("version", sa.Integer(), server_default=sa.text("1"), nullable=False),
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(VERSIONED_TABLES):
+        op.drop_column(table, "version")
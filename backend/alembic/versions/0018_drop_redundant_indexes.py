@@ -0,0 +1,39 @@
+"""Drop indexes duplicated by primary keys and composite indexes
+
+The id columns were declared with both primary_key=True and index=True,
+giving each table a second B-tree identical to its primary key.
+ix_assets_status is covered by the leading column of ix_asset_status_dept.
+Every insert and update maintained these indexes without any query needing
+them.
+
+Revision ID: 0018
+Revises: 0017
+Create Date: 2024-01-18 00:00:00
+"""
+
+from alembic import op
+
+revision = "0018"
+down_revision = "0017"
+branch_labels = None
+depends_on = None
+
+REDUNDANT_INDEXES = (
+    ("users", "ix_users_id", "id"),
+    ("asset_issuances", "ix_asset_issuances_id", "id"),
+    ("notifications", "ix_notifications_id", "id"),
+    ("audit_logs", "ix_audit_logs_id", "id"),
+    ("asset_documents", "ix_asset_documents_id", "id"),
+    ("document_templates", "ix_document_templates_id", "id"),
+    ("assets", "ix_assets_status", "status"),
+)
+
+
+def upgrade() -> None:
+    for table, name, _ in REDUNDANT_INDEXES:
+        op.drop_index(name, table_name=table)
+
+
+def downgrade() -> None:
+    for table, name, column in reversed(REDUNDANT_INDEXES):
+        op.create_index(name, table, [column])
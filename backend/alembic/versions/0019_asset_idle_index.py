@@ -0,0 +1,29 @@
+"""Index in-use assets by last update for the idle asset check
+
+The dashboard lists assets that are in use and have not been updated for 30
+days. ix_asset_idle is a partial index over updated_at WHERE
+status = 'in_use', so the check reads only in-use assets.
+
+Revision ID: 0019
+Revises: 0018
+Create Date: 2024-01-19 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0019"
+down_revision = "0018"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_asset_idle", "assets", ["updated_at"],
+        postgresql_where=sa.text("status = 'in_use'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_asset_idle", table_name="assets")
@@ -0,0 +1,37 @@
+"""Add trigram indexes for the asset search
+
+The asset list and user asset searches match ILIKE '%term%' against
+asset_id, brand, model and serial_number. A leading wildcard cannot use a
+btree index, so every search scanned the whole table. GIN indexes with the
+pg_trgm operator class serve these patterns, one per column so the existing
+OR of the four conditions is answered with a bitmap OR of the indexes.
+
+Revision ID: 0020
+Revises: 0019
+Create Date: 2024-01-20 00:00:00
+"""
+
+from alembic import op
+
+revision = "0020"
+down_revision = "0019"
+branch_labels = None
+depends_on = None
+
+SEARCH_COLUMNS = ("asset_id", "brand", "model", "serial_number")
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in SEARCH_COLUMNS:
+        op.create_index(
+            f"ix_asset_{column}_trgm", "assets", [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    for column in SEARCH_COLUMNS:
+        op.drop_index(f"ix_asset_{column}_trgm", table_name="assets")
+    # pg_trgm is left installed; other objects may depend on it
@@ -0,0 +1,41 @@
+"""Set delete rules on the foreign keys to assets
+
+delete_asset checked for open issuances with a separate query before the
+DELETE, and every delete then failed anyway because the deletion's own audit
+entry (and any earlier one) still referenced the asset. Issuance records and
+documents now reference assets with ON DELETE RESTRICT, so the database
+rejects deleting an issued asset by itself. Audit log entries and
+notifications use ON DELETE SET NULL and keep the asset identifier text.
+
+Revision ID: 0021
+Revises: 0020
+Create Date: 2024-01-21 00:00:00
+"""
+
+from alembic import op
+
+revision = "0021"
+down_revision = "0020"
+branch_labels = None
+depends_on = None
+
+DELETE_RULES = (
+    ("asset_issuances", "RESTRICT"),
+    ("asset_documents", "RESTRICT"),
+    ("audit_logs", "SET NULL"),
+    ("notifications", "SET NULL"),
+)
+
+
+def upgrade() -> None:
+    for table, rule in DELETE_RULES:
+        name = f"{table}_asset_id_fkey"
+        op.drop_constraint(name, table, type_="foreignkey")
+        op.create_foreign_key(name, table, "assets", ["asset_id"], ["id"], ondelete=rule)
+
+
+def downgrade() -> None:
+    for table, _rule in reversed(DELETE_RULES):
+        name = f"{table}_asset_id_fkey"
+        op.drop_constraint(name, table, type_="foreignkey")
+        op.create_foreign_key(name, table, "assets", ["asset_id"], ["id"])
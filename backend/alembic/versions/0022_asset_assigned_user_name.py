@@ -0,0 +1,32 @@
+"""Store the assigned user's name on assets
+
+Every asset response shows the assigned user's name, which cost a join or
+an extra users lookup on the list, detail, dashboard and export paths.
+assets.assigned_user_name now holds a copy of users.full_name, written
+together with assigned_user_id and updated when a user is renamed. Existing
+rows are backfilled from users.
+
+Revision ID: 0022
+Revises: 0021
+Create Date: 2024-01-22 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0022"
+down_revision = "0021"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("assets", sa.Column("assigned_user_name", sa.String(length=100), nullable=True))
+    op.execute(
+        "UPDATE assets SET assigned_user_name = users.full_name "
+        "FROM users WHERE users.id = assets.assigned_user_id"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("assets", "assigned_user_name")
@@ -0,0 +1,42 @@
+"""Add type to the asset filter index and index issuance history by date
+
+ix_asset_status_dept becomes ix_asset_status_dept_type so list views that
+also filter by asset type (user-types, the type filter of the asset list)
+resolve the whole filter in the index. The asset history reads every
+issuance of an asset ordered by issued_date descending; the single-column
+ix_asset_issuances_asset_id is replaced by ix_issuance_asset_issued on
+(asset_id, issued_date DESC), which returns the rows already sorted and
+still serves foreign key checks through its leading column.
+
+The warranty and idle-asset filters already have partial indexes
+(ix_asset_warranty_soon, ix_asset_idle) and the search has per-column
+trigram indexes (0020), so those are unchanged.
+
+Revision ID: 0023
+Revises: 0022
+Create Date: 2024-01-23 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0023"
+down_revision = "0022"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_asset_status_dept_type", "assets", ["status", "department", "type"])
+    op.drop_index("ix_asset_status_dept", table_name="assets")
+    op.create_index(
+        "ix_issuance_asset_issued", "asset_issuances", ["asset_id", sa.text("issued_date DESC")]
+    )
+    op.drop_index("ix_asset_issuances_asset_id", table_name="asset_issuances")
+
+
+def downgrade() -> None:
+    op.create_index("ix_asset_issuances_asset_id", "asset_issuances", ["asset_id"])
+    op.drop_index("ix_issuance_asset_issued", table_name="asset_issuances")
+    op.create_index("ix_asset_status_dept", "assets", ["status", "department"])
+    op.drop_index("ix_asset_status_dept_type", table_name="assets")
@@ -0,0 +1,92 @@
+"""
+Cache configuration module.
+This module sets up the dogpile.cache region for short-lived, read-mostly
+query results such as the dashboard aggregates.
+
+Only plain, already-serialized data (dicts, lists, numbers, strings) is
+cached, never ORM objects, so values can be pickled into Redis and shared
+between worker processes.
+
+The cache only ever saves work: if the backend fails (e.g. Redis is down),
+values are computed directly and the failure is logged.
+"""
+
+import logging
+import threading
+from typing import Optional
+
+from dogpile.cache import make_region
+
+from app.core.config import settings
+
+# Keys of the dashboard values cached in dashboard_region
+ASSET_COUNTS_KEY = "dashboard:asset_counts"
+WARRANTY_ALERTS_KEY = "dashboard:warranty_alerts"
+IDLE_ASSETS_KEY = "dashboard:idle_assets"
+DASHBOARD_PAYLOAD_KEY = "dashboard:payload"
+DASHBOARD_KEYS = (ASSET_COUNTS_KEY, WARRANTY_ALERTS_KEY, IDLE_ASSETS_KEY, DASHBOARD_PAYLOAD_KEY)
+
+dashboard_region = make_region(name="dashboard")
+_configure_lock = threading.Lock()
+
+logger = logging.getLogger(__name__)
+
+
+def _configured_region():
+    """Return dashboard_region, configuring it from settings on first use."""
+    if dashboard_region.is_configured:
+        return dashboard_region
+    with _configure_lock:
+        if not dashboard_region.is_configured:
+            arguments = {}
+            if settings.CACHE_BACKEND == "dogpile.cache.redis":
+                arguments = {"url": settings.REDIS_URL, "distributed_lock": True}
+            dashboard_region.configure(
+                settings.CACHE_BACKEND,
+                expiration_time=settings.DASHBOARD_CACHE_SECONDS,
+                arguments=arguments,
+            )
+    return dashboard_region
+
+
+def get_or_compute(key: str, creator, expiration_time: Optional[int] = None):
+    """
+    Return the cached value for key, calling creator() to fill a miss.
+    
+    Concurrent misses for the same key in one process wait for a single
+    creator() call instead of all hitting the database (dogpile lock).
+    expiration_time overrides DASHBOARD_CACHE_SECONDS for this key.
+    
+    Errors raised by creator() propagate; cache backend errors do not.
+    """
+    outcome = {}
+    
+    def tracked_creator():
+        try:
+            outcome["value"] = creator()
+        except Exception:
+            outcome["failed"] = True
+            raise
+        return outcome["value"]
+    
+    try:
+        return _configured_region().get_or_create(key, tracked_creator, expiration_time=expiration_time)
+    except Exception:
+        if outcome.get("failed"):
+            raise
+        logger.warning("Cache unavailable, computing %s directly", key, exc_info=True)
+        return outcome["value"] if "value" in outcome else creator()
+
+
+def invalidate_dashboard_cache() -> None:
+    """
+    Drop the cached dashboard values.
+    
+    Call after committing any change to assets or issuances. With a shared
+    backend this also clears the values other workers computed.
+    """
+    try:
+        _configured_region().delete_multi(DASHBOARD_KEYS)
+    except Exception:
+        # Cached values then stay until they expire (DASHBOARD_CACHE_SECONDS)
+        logger.warning("Cache unavailable, could not invalidate the dashboard", exc_info=True)
@@ -3,23 +3,78 @@ Database configuration module.
 This module sets up the SQLAlchemy database connection and session management.
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
+import logging
+
+import orjson
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine.default import CACHE_MISS, CACHING_DISABLED, NO_CACHE_KEY
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.models.base import Base  # shared declarative base, re-exported here
+
+logger = logging.getLogger(__name__)
+
+def _json_serializer(value) -> str:
+    """
+    Serialize JSONB column values with orjson.
+    
+    Datetimes and enums are encoded natively; anything else orjson does not
+    know (e.g. Decimal purchase costs in audit values) is stored as a string.
+    """
+    return orjson.dumps(value, default=str).decode()
 
-# Create database engine
+# Create database engine.
+# The pool keeps up to DB_POOL_SIZE + DB_MAX_OVERFLOW connections open so
+# requests reuse them instead of paying a new handshake; pre-ping discards
+# connections the server closed while idle and DB_POOL_RECYCLE retires them
+# before server/proxy idle timeouts. Compiled SQL is cached per engine in an
+# LRU sized by query_cache_size, large enough to hold every distinct
+# statement the routers issue.
 engine = create_engine(
     settings.DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
     pool_pre_ping=True,
-    pool_recycle=300
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    query_cache_size=1200,
+    # Multi-row inserts (session.execute(insert(Model), rows)) are sent as
+    # INSERT ... VALUES (...), (...) pages of up to 1000 rows, and other
+    # executemany() calls (bulk UPDATEs) use psycopg2's execute_batch
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=1000,
+    # JSONB values (audit old/new values, document form data, template
+    # schemas) are encoded and parsed with orjson
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
-# Create sessionmaker
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def _report_statement_cache(conn, cursor, statement, parameters, context, executemany):
+    """
+    Log statements that missed or bypassed the compiled statement cache.
+    
+    A miss is expected the first time each statement runs. A statement that
+    can never be cached (e.g. a custom type without cache_ok = True) compiles
+    on every execution and is reported as a warning.
+    """
+    if context is None or context.compiled is None or context.isddl:
+        return
+    if context.cache_hit in (NO_CACHE_KEY, CACHING_DISABLED):
+        logger.warning("Uncacheable SQL statement (%s): %s",
+                       context._get_cache_stats(), statement)
+    elif context.cache_hit is CACHE_MISS:
+        logger.debug("Statement cache miss: %s", statement)
+
+# Development aid only; the listener adds overhead to every execution
+if settings.DEBUG:
+    event.listen(engine, "before_cursor_execute", _report_statement_cache)
 
-# Base class for models
-Base = declarative_base()
+# Create sessionmaker.
+# Objects stay loaded after commit: handlers commit (e.g. create_audit_log)
+# and then keep reading the same rows to build their response, which would
+# otherwise re-SELECT every committed object. Server-generated values are
+# fetched by RETURNING at flush (eager_defaults on the mappers).
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 def get_db():
     """
@@ -35,5 +90,8 @@ def create_tables():
     """
     Create all tables in the database
     """
-    from app.models.models import Base
-    Base.metadata.create_all(bind=engine) 
\ No newline at end of file
+    import app.models.models  # noqa: F401  (registers the tables on Base)
+    with engine.begin() as connection:
+        # Provides gin_trgm_ops for the asset search indexes
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    Base.metadata.create_all(bind=engine)
\ No newline at end of file
@@ -4,58 +4,190 @@ This module sets up the FastAPI application with all necessary configurations,
 middleware, and routes.
 """
 
-from fastapi import FastAPI
+import asyncio
+import logging
+import orjson
+from anyio import to_thread
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from contextlib import asynccontextmanager
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from contextlib import asynccontextmanager, suppress
+from functools import lru_cache
+from sqlalchemy.orm.exc import StaleDataError
 
 from app.core.config import settings
-from app.core.database import create_tables
+from app.core.database import SessionLocal, create_tables
 from app.routers import assets, users, auth, documents
 
 
+# Methods and request headers the frontend actually uses cross-origin;
+# CORS-safelisted headers such as Accept are always allowed by Starlette.
+CORS_METHODS = ("GET", "POST", "PUT", "DELETE", "PATCH")
+CORS_HEADERS = ("Authorization", "Content-Type")
+
+# Seconds without a dashboard request after which a worker stops refreshing
+# the cached dashboard in the background
+DASHBOARD_IDLE_SECONDS = 300
+
+logger = logging.getLogger(__name__)
+
+
+def _load_document_templates() -> dict:
+    """Read every document template with a short-lived session."""
+    db = SessionLocal()
+    try:
+        return documents.load_document_templates(db)
+    finally:
+        db.close()
+
+async def _refresh_dashboard(max_age: int) -> None:
+    """Recompute the cached dashboard if it is older than max_age seconds."""
+    try:
+        await run_in_threadpool(assets.refresh_dashboard_cache, max_age)
+    except Exception:
+        logger.exception("Failed to refresh the dashboard cache")
+
+async def _keep_dashboard_warm(interval: int) -> None:
+    """
+    Pre-warm the cached dashboard, then keep it from expiring while it is polled.
+    
+    Every interval seconds, a payload that would expire within the next
+    interval is recomputed ahead of time. The refresh takes the cache's lock,
+    so with the shared Redis backend one worker recomputes per period instead
+    of every worker. Once this worker has not served the dashboard for
+    DASHBOARD_IDLE_SECONDS it stops refreshing, and the next request computes
+    the payload as usual.
+    """
+    max_age = max(settings.DASHBOARD_PAYLOAD_CACHE_SECONDS - interval, 1)
+    await _refresh_dashboard(max_age)
+    while True:
+        await asyncio.sleep(interval)
+        if assets.dashboard_idle_seconds() < DASHBOARD_IDLE_SECONDS:
+            await _refresh_dashboard(max_age)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup
-    create_tables()
+    # Startup. The database driver is blocking, so the optional DDL check and
+    # the template preload run in a worker thread instead of stalling the
+    # event loop while the server is starting. The schema is normally
+    # migrated by Alembic before the workers start (see docker-entrypoint.sh).
+    if settings.RUN_MIGRATIONS_ON_STARTUP:
+        await run_in_threadpool(create_tables)
+    
+    # Sync endpoints each hold a pooled connection while they run in the
+    # threadpool. Cap the threadpool (anyio's default is 40) at what the pool
+    # can hand out, so excess requests queue for a thread up front instead
+    # of occupying one while waiting DB_POOL_TIMEOUT for a connection
+    to_thread.current_default_thread_limiter().total_tokens = (
+        settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    )
+    
+    # Document templates are static; keep them in memory instead of
+    # querying them on every render
+    app.state.templates = await run_in_threadpool(_load_document_templates)
+    
+    # Pre-warm the dashboard, and keep it cached while it is being polled
+    dashboard_warmer = None
+    if settings.DASHBOARD_PREWARM_SECONDS > 0:
+        dashboard_warmer = asyncio.create_task(_keep_dashboard_warm(settings.DASHBOARD_PREWARM_SECONDS))
     yield
-    # Shutdown
-    pass
-
-app = FastAPI(
-    title=settings.APP_NAME,
-    version=settings.VERSION,
-    description="A comprehensive IT Asset Management System for tracking and managing IT equipment",
-    lifespan=lifespan
-)
-
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Include routers
-app.include_router(auth.router, prefix="/api/v1")
-app.include_router(assets.router, prefix="/api/v1")
-app.include_router(users.router, prefix="/api/v1")
-app.include_router(documents.router, prefix="/api")
-
-@app.get("/")
-def read_root():
-    return {
+    # Shutdown: stop the background refresh
+    if dashboard_warmer is not None:
+        dashboard_warmer.cancel()
+        with suppress(asyncio.CancelledError):
+            await dashboard_warmer
+
+def _build_app() -> FastAPI:
+    """
+    Build the FastAPI application with its middleware and routes.
+    
+    Settings are resolved here rather than at import time, so importing this
+    module stays cheap until an application is actually requested.
+    """
+    app = FastAPI(
+        title=settings.APP_NAME,
+        version=settings.VERSION,
+        description="A comprehensive IT Asset Management System for tracking and managing IT equipment",
+        lifespan=lifespan,
+        # Serialize every JSON response with orjson instead of the stdlib encoder
+        default_response_class=ORJSONResponse
+    )
+
+    # CORS middleware. Origins are matched by set membership, and the
+    # middleware is left out entirely when no cross-origin callers are
+    # configured (e.g. frontend served from the same origin by a proxy).
+    cors_origins = frozenset(settings.CORS_ORIGINS)
+    if cors_origins:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=cors_origins,
+            allow_credentials=True,
+            allow_methods=CORS_METHODS,
+            allow_headers=CORS_HEADERS,
+        )
+
+    # Compress responses clients accept gzip for. Small bodies are sent as-is,
+    # and a low compression level keeps the CPU cost per response small while
+    # still shrinking the JSON asset lists several times over.
+    app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=4)
+
+    # A row changed between being read and being written (version_id_col)
+    @app.exception_handler(StaleDataError)
+    async def stale_data_handler(request: Request, exc: StaleDataError):
+        return ORJSONResponse(
+            status_code=409,
+            content={"detail": "The record was modified by another request; reload it and try again"},
+        )
+
+    # Include routers
+    app.include_router(auth.router, prefix="/api/v1")
+    app.include_router(assets.router, prefix="/api/v1")
+    app.include_router(users.router, prefix="/api/v1")
+    app.include_router(documents.router, prefix="/api")
+
+    # The root and health payloads never change while the process runs, so they
+    # are serialized once; each request only wraps the cached bytes in a Response.
+    root_body = orjson.dumps({
         "message": f"Welcome to {settings.APP_NAME}",
         "version": settings.VERSION,
         "docs": "/docs",
         "api": "/api/v1"
-    }
+    })
+    health_body = orjson.dumps({"status": "healthy"})
+
+    # No I/O here, so run directly on the event loop instead of a threadpool
+    @app.get("/")
+    async def read_root():
+        return Response(content=root_body, media_type="application/json")
+
+    @app.get("/health")
+    async def health_check():
+        return Response(content=health_body, media_type="application/json")
+
+    return app
+
+@lru_cache(maxsize=1)
+def get_app() -> FastAPI:
+    """Return the process-wide application, building it on first use."""
+    return _build_app()
 
-@app.get("/health")
-def health_check():
-    return {"status": "healthy"}
+# Module-level instance so `uvicorn app.main:app` keeps working
+app = get_app()
 
 if __name__ == "__main__":
+    import os
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
+    # Production-style launch: uvloop event loop, httptools HTTP parser and one
+    # worker per CPU. Workers need an import string rather than an app object.
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count(),
+        log_level="warning",
+        access_log=False,
+    )
@@ -4,20 +4,45 @@ This module provides the base class and common mixins for all database models.
 """
 
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import Column, Integer, DateTime
+from sqlalchemy import DateTime, MetaData, func
+from sqlalchemy.orm import Mapped, mapped_column
 from datetime import datetime
 
-# Create declarative base class for all models
-Base = declarative_base()
+# Constraint and index naming convention. The patterns reproduce the names
+# PostgreSQL (and SQLAlchemy for indexes) already gave the existing schema, so
+# deployed databases conform without renames while Alembic autogenerate gets
+# deterministic names. Check constraints are always named explicitly.
+NAMING_CONVENTION = {
+    "ix": "ix_%(column_0_label)s",
+    "uq": "%(table_name)s_%(column_0_name)s_key",
+    "fk": "%(table_name)s_%(column_0_name)s_fkey",
+    "pk": "%(table_name)s_pkey",
+}
+
+def utcnow():
+    """
+    SQL expression for the current UTC time as a naive timestamp.
+    
+    Used as server_default/onupdate for timestamp columns so PostgreSQL stamps
+    rows itself, and in time-window filters so they use the database clock.
+    The value matches what datetime.utcnow() produced before, independent of
+    the database session's TimeZone setting.
+    """
+    return func.timezone("utc", func.now(), type_=DateTime)
+
+# Create declarative base class for all models. This is the only declarative
+# base in the application; models.py and core/database.py import it from here
+# so every table lives in a single MetaData.
+Base = declarative_base(metadata=MetaData(naming_convention=NAMING_CONVENTION))
 
 class TimestampMixin:
     """
     Mixin class that adds created_at and updated_at timestamp columns to models.
-    These fields are automatically managed by SQLAlchemy.
+    These fields are stamped by the database on insert and update.
     """
     # Column for tracking when the record was created
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=utcnow(), nullable=False)
     
     # Column for tracking when the record was last updated
     # Automatically updates when the record is modified
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False) 
\ No newline at end of file
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False) 
\ No newline at end of file
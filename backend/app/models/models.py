@@ -9,25 +9,37 @@ All models inherit from SQLAlchemy's declarative base and include:
 - Relationships between entities
 - Enums for status and role management
 - Timestamp tracking for audit purposes
+- Relationships declared with lazy="raise": accessing one that was not
+  eager-loaded (selectinload()/joinedload() on the query) raises instead of
+  silently issuing one extra SELECT per row
 
 Author: IT Asset Management System
 Created: 2024
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Enum as SQLEnum
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy import Integer, String, DateTime, Boolean, Text, ForeignKey, CheckConstraint, Index, LargeBinary, Numeric, Enum as SQLEnum, text
+from sqlalchemy.dialects.postgresql import INET, JSONB
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
+from decimal import Decimal
+from typing import List, Optional
 import enum
 
-# Create the declarative base class for all models
-Base = declarative_base()
+from .base import Base, utcnow
 
 
-class AssetStatus(enum.Enum):
+def _enum_values(enum_cls):
+    """Store enum columns by member value (e.g. 'admin') rather than name."""
+    return [member.value for member in enum_cls]
+
+
+class AssetStatus(enum.StrEnum):
     """
     Enumeration of possible asset statuses.
     
+    Members are plain strings, so they compare equal to the raw values stored
+    in the assets.status column and serialize without unwrapping .value.
+    
     This enum defines the lifecycle states an asset can be in:
     - AVAILABLE: Asset is ready for assignment to users
     - PENDING_FOR_SIGNATURE: Asset assigned but waiting for user to sign documents
@@ -42,10 +54,13 @@ class AssetStatus(enum.Enum):
     RETIRED = "retired"                   # Asset is end-of-life, no longer usable
 
 
-class UserRole(enum.Enum):
+class UserRole(enum.StrEnum):
     """
     Enumeration of user roles in the system.
     
+    Members are plain strings equal to their values, which are also the
+    labels stored in the userrole database enum.
+    
     Defines the access levels and permissions:
     - ADMIN: Full system access, can manage all resources
     - MANAGER: Can manage assets and users in their department
@@ -71,33 +86,47 @@ class User(Base):
     __tablename__ = "users"
 
     # Primary key and unique identifiers
-    id = Column(Integer, primary_key=True, index=True, doc="Unique user identifier")
-    username = Column(String(50), unique=True, index=True, nullable=False, 
-                     doc="Unique username for authentication")
-    email = Column(String(100), unique=True, index=True, nullable=False,
-                  doc="User's email address, must be unique")
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, doc="Unique user identifier")
+    username: Mapped[str] = mapped_column(String(50), unique=True, index=True, nullable=False, 
+                                         doc="Unique username for authentication")
+    email: Mapped[str] = mapped_column(String(100), unique=True, index=True, nullable=False,
+                                      doc="User's email address, must be unique")
     
     # User profile information
-    full_name = Column(String(100), nullable=False, doc="User's full display name")
-    department = Column(String(50), nullable=False, doc="Department the user belongs to")
+    full_name: Mapped[str] = mapped_column(String(100), nullable=False, doc="User's full display name")
+    department: Mapped[str] = mapped_column(String(50), nullable=False, doc="Department the user belongs to")
     
     # Access control and authentication
-    role = Column(SQLEnum(UserRole), default=UserRole.VIEWER, 
-                 doc="User's role determining their system permissions")
-    hashed_password = Column(String(255), nullable=False, 
-                           doc="Bcrypt hashed password for authentication")
-    is_active = Column(Boolean, default=True, 
-                      doc="Whether the user account is active and can log in")
+    role: Mapped[Optional[UserRole]] = mapped_column(SQLEnum(UserRole, values_callable=_enum_values), default=UserRole.VIEWER, 
+                                                    doc="User's role determining their system permissions")
+    hashed_password: Mapped[str] = mapped_column(String(255), nullable=False, 
+                                               doc="Bcrypt hashed password for authentication")
+    is_active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True, 
+                                                     doc="Whether the user account is active and can log in")
     
     # Audit timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, 
-                       doc="Timestamp when the user account was created")
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow,
-                       doc="Timestamp when the user account was last modified")
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow(), 
+                                                          doc="Timestamp when the user account was created")
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow(), onupdate=utcnow(),
+                                                          doc="Timestamp when the user account was last modified")
+    
+    # Optimistic concurrency: every UPDATE is conditional on the version that
+    # was read and increments it; a concurrent change raises StaleDataError
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("1"),
+                                        doc="Row version, incremented on every update")
+    # eager_defaults: server-generated values (timestamps, version) come back
+    # through RETURNING on INSERT/UPDATE, so no refresh() SELECT is needed
+    __mapper_args__ = {"version_id_col": version, "eager_defaults": True}
 
     # Relationships
-    issued_assets = relationship("AssetIssuance", back_populates="user",
-                               doc="All asset issuances for this user")
+    issued_assets: Mapped[List["AssetIssuance"]] = relationship("AssetIssuance", back_populates="user", lazy="raise",
+                                                              doc="All asset issuances for this user")
+    assigned_assets: Mapped[List["Asset"]] = relationship("Asset", back_populates="assigned_user", lazy="raise",
+                                                        doc="Assets currently assigned to this user")
+
+
+# Columns matched by the asset search box, each with a trigram index
+ASSET_SEARCH_COLUMNS = ("asset_id", "brand", "model", "serial_number")
 
 
 class Asset(Base):
@@ -114,62 +143,104 @@ class Asset(Base):
     - One-to-many with AssetIssuance (assets can have multiple issuance records)
     """
     __tablename__ = "assets"
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ({})".format(", ".join(f"'{s.value}'" for s in AssetStatus)),
+            name="ck_assets_status",
+        ),
+        # Supports the status/department/type filters used by list and dashboard
+        # views, and status or status/department filters through its leading
+        # columns
+        Index("ix_asset_status_dept_type", "status", "department", "type"),
+        # Supports the warranty expiry alert window (WARRANTY_ALERT_DAYS).
+        # Retired assets never raise alerts, so they are left out of the index;
+        # the alert query repeats the status <> 'retired' predicate to use it.
+        Index("ix_asset_warranty_soon", "warranty_expiry", postgresql_where=text("status <> 'retired'")),
+        # Supports the dashboard's idle asset check (in use, not updated for
+        # 30 days); only assets in use are indexed
+        Index("ix_asset_idle", "updated_at", postgresql_where=text("status = 'in_use'")),
+        # Supports "assets assigned to user" lookups
+        Index("ix_asset_assigned", "assigned_user_id"),
+        # Trigram indexes (pg_trgm) for the substring search ILIKE '%term%' over
+        # these columns, which a btree index cannot serve; the OR of the four
+        # conditions is answered by combining the indexes
+        *(
+            Index(f"ix_asset_{column}_trgm", column,
+                  postgresql_using="gin", postgresql_ops={column: "gin_trgm_ops"})
+            for column in ASSET_SEARCH_COLUMNS
+        ),
+    )
 
     # Primary key and asset identification
-    id = Column(Integer, primary_key=True, index=True, doc="Unique asset database ID")
-    asset_id = Column(String(50), unique=True, index=True, nullable=False,
-                     doc="System-generated asset identifier (e.g., LAP-001, RTR-002)")
-    asset_tag = Column(String(100), nullable=True, index=True,
-                      doc="Finance department assigned asset tag (e.g., FIN-2024-001, COMP-12345)")
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, doc="Unique asset database ID")
+    asset_id: Mapped[str] = mapped_column(String(50), unique=True, index=True, nullable=False,
+                                         doc="System-generated asset identifier (e.g., LAP-001, RTR-002)")
+    asset_tag: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, index=True,
+                                                    doc="Finance department assigned asset tag (e.g., FIN-2024-001, COMP-12345)")
     
     # Asset categorization and description
-    type = Column(String(50), nullable=False, doc="Asset type (laptop, monitor, etc.)")
-    brand = Column(String(100), nullable=False, doc="Manufacturer brand name")
-    model = Column(String(100), nullable=False, doc="Specific model designation")
-    serial_number = Column(String(100), unique=True, nullable=True,
-                          doc="Manufacturer serial number (if available)")
+    type: Mapped[str] = mapped_column(String(50), nullable=False, doc="Asset type (laptop, monitor, etc.)")
+    brand: Mapped[str] = mapped_column(String(100), nullable=False, doc="Manufacturer brand name")
+    model: Mapped[str] = mapped_column(String(100), nullable=False, doc="Specific model designation")
+    serial_number: Mapped[Optional[str]] = mapped_column(String(100), unique=True, nullable=True,
+                                                        doc="Manufacturer serial number (if available)")
     
     # Organizational information
-    department = Column(String(50), nullable=False, 
-                       doc="Department responsible for this asset")
-    location = Column(String(100), nullable=True,
-                     doc="Physical location where asset is stored/used")
+    department: Mapped[str] = mapped_column(String(50), nullable=False, 
+                                           doc="Department responsible for this asset")
+    location: Mapped[Optional[str]] = mapped_column(String(100), nullable=True,
+                                                   doc="Physical location where asset is stored/used")
     
     # Financial and warranty information
-    purchase_date = Column(DateTime, nullable=False, 
-                          doc="Date when the asset was purchased")
-    warranty_expiry = Column(DateTime, nullable=False,
-                           doc="Date when manufacturer warranty expires")
-    purchase_cost = Column(String(20), nullable=True,
-                          doc="Original purchase cost (stored as string for flexibility)")
+    purchase_date: Mapped[datetime] = mapped_column(DateTime, nullable=False, 
+                                                   doc="Date when the asset was purchased")
+    warranty_expiry: Mapped[datetime] = mapped_column(DateTime, nullable=False,
+                                                    doc="Date when manufacturer warranty expires")
+    purchase_cost: Mapped[Optional[Decimal]] = mapped_column(Numeric(12, 2), nullable=True,
+                                                            doc="Original purchase cost")
     
     # Asset condition and status
-    condition = Column(String(50), default="Good",
-                      doc="Physical condition (Excellent, Good, Fair, Poor)")
-    notes = Column(Text, nullable=True, doc="Additional notes or comments about the asset")
-    status = Column(SQLEnum(AssetStatus), default=AssetStatus.AVAILABLE,
-                   doc="Current lifecycle status of the asset")
+    condition: Mapped[Optional[str]] = mapped_column(String(50), default="Good",
+                                                    doc="Physical condition (Excellent, Good, Fair, Poor)")
+    notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True, doc="Additional notes or comments about the asset")
+    status: Mapped[Optional[str]] = mapped_column(String(24), default=AssetStatus.AVAILABLE,
+                                                 doc="Current lifecycle status of the asset (one of AssetStatus)")
     
     # Operating System information (for servers and computers)
-    os = Column(String(100), nullable=True,
-                doc="Operating system name (e.g., Windows Server 2019, Ubuntu Server 20.04)")
-    os_version = Column(String(50), nullable=True,
-                       doc="Operating system version (e.g., 10.0(14393), 5.4.0-74)")
+    os: Mapped[Optional[str]] = mapped_column(String(100), nullable=True,
+                                              doc="Operating system name (e.g., Windows Server 2019, Ubuntu Server 20.04)")
+    os_version: Mapped[Optional[str]] = mapped_column(String(50), nullable=True,
+                                                     doc="Operating system version (e.g., 10.0(14393), 5.4.0-74)")
     
     # Assignment tracking
-    assigned_user_id = Column(Integer, ForeignKey("users.id"), nullable=True,
-                             doc="ID of user currently assigned this asset (if any)")
+    assigned_user_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("users.id"), nullable=True,
+                                                           doc="ID of user currently assigned this asset (if any)")
+    # Denormalized copy of the assigned user's full_name, so asset reads never
+    # join users. Set together with assigned_user_id, and updated by
+    # update_user when a user is renamed.
+    assigned_user_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True,
+                                                             doc="Full name of the assigned user (copy of users.full_name)")
     
     # Audit timestamps
-    created_at = Column(DateTime, default=datetime.utcnow,
-                       doc="Timestamp when asset record was created")
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow,
-                       doc="Timestamp when asset record was last modified")
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow(),
+                                                          doc="Timestamp when asset record was created")
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow(), onupdate=utcnow(),
+                                                          doc="Timestamp when asset record was last modified")
+    
+    # Optimistic concurrency: every UPDATE is conditional on the version that
+    # was read and increments it; a concurrent change raises StaleDataError
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("1"),
+                                        doc="Row version, incremented on every update")
+    # eager_defaults: server-generated values (timestamps, version) come back
+    # through RETURNING on INSERT/UPDATE, so no refresh() SELECT is needed
+    __mapper_args__ = {"version_id_col": version, "eager_defaults": True}
 
     # Relationships
-    assigned_user = relationship("User", doc="User currently assigned to this asset")
-    issuances = relationship("AssetIssuance", back_populates="asset",
-                           doc="All issuance records for this asset")
+    assigned_user: Mapped[Optional["User"]] = relationship("User", back_populates="assigned_assets", lazy="raise",
+                                                          doc="User currently assigned to this asset")
+    issuances: Mapped[List["AssetIssuance"]] = relationship("AssetIssuance", back_populates="asset", lazy="raise",
+                                                          passive_deletes="all",
+                                                          doc="All issuance records for this asset")
 
 
 class AssetIssuance(Base):
@@ -186,37 +257,60 @@ class AssetIssuance(Base):
     - Many-to-one with User (multiple issuances can exist for one user)
     """
     __tablename__ = "asset_issuances"
+    __table_args__ = (
+        # Partial indexes over open issuances only (return_date IS NULL):
+        # "latest open issuance of this asset", "what does this user hold" and
+        # the dashboard's most recent open issuances stay small no matter how
+        # much history accumulates
+        Index("ix_issuance_asset_open", "asset_id", "issued_date", postgresql_where=text("return_date IS NULL")),
+        Index("ix_issuance_user_open", "user_id", "asset_id", postgresql_where=text("return_date IS NULL")),
+        Index("ix_issuance_open_issued", "issued_date", postgresql_where=text("return_date IS NULL")),
+        # An asset's complete issuance history, newest first, read in index
+        # order; the leading asset_id also serves foreign key checks on delete.
+        # user_id is indexed in full (index=True) for the same reason.
+        Index("ix_issuance_asset_issued", "asset_id", text("issued_date DESC")),
+    )
 
     # Primary key
-    id = Column(Integer, primary_key=True, index=True, doc="Unique issuance record ID")
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, doc="Unique issuance record ID")
     
     # Foreign key relationships
-    asset_id = Column(Integer, ForeignKey("assets.id"), nullable=False,
-                     doc="ID of the asset being issued")
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False,
-                    doc="ID of the user receiving the asset")
+    # RESTRICT: an asset with issuance records cannot be deleted; the database
+    # rejects the DELETE itself (see delete_asset)
+    asset_id: Mapped[int] = mapped_column(Integer, ForeignKey("assets.id", ondelete="RESTRICT"), nullable=False,
+                                         doc="ID of the asset being issued")
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False, index=True,
+                                        doc="ID of the user receiving the asset")
     
     # Issuance timeline
-    issued_date = Column(DateTime, default=datetime.utcnow,
-                        doc="Date and time when asset was issued")
-    expected_return_date = Column(DateTime, nullable=True,
-                                 doc="Expected return date (optional)")
-    return_date = Column(DateTime, nullable=True,
-                        doc="Actual return date (None if still issued)")
+    issued_date: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow(),
+                                                           doc="Date and time when asset was issued")
+    expected_return_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True,
+                                                                    doc="Expected return date (optional)")
+    return_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True,
+                                                           doc="Actual return date (None if still issued)")
     
     # Additional information
-    notes = Column(Text, nullable=True, doc="Notes about this issuance")
-    issued_by = Column(String(100), doc="Username of person who issued the asset")
+    notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True, doc="Notes about this issuance")
+    issued_by: Mapped[Optional[str]] = mapped_column(String(100), doc="Username of person who issued the asset")
     
     # Audit timestamp
-    created_at = Column(DateTime, default=datetime.utcnow,
-                       doc="Timestamp when issuance record was created")
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow(),
+                                                          doc="Timestamp when issuance record was created")
+    
+    # Optimistic concurrency: every UPDATE is conditional on the version that
+    # was read and increments it; a concurrent change raises StaleDataError
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("1"),
+                                        doc="Row version, incremented on every update")
+    # eager_defaults: server-generated values (timestamps, version) come back
+    # through RETURNING on INSERT/UPDATE, so no refresh() SELECT is needed
+    __mapper_args__ = {"version_id_col": version, "eager_defaults": True}
 
     # Relationships
-    asset = relationship("Asset", back_populates="issuances",
-                        doc="The asset that was issued")
-    user = relationship("User", back_populates="issued_assets",
-                       doc="The user who received the asset")
+    asset: Mapped["Asset"] = relationship("Asset", back_populates="issuances", lazy="raise",
+                                         doc="The asset that was issued")
+    user: Mapped["User"] = relationship("User", back_populates="issued_assets", lazy="raise",
+                                       doc="The user who received the asset")
 
 
 class Notification(Base):
@@ -232,32 +326,37 @@ class Notification(Base):
     Notifications can be asset-specific, user-specific, or general system alerts.
     """
     __tablename__ = "notifications"
+    __table_args__ = (
+        # Unread notifications per user, newest first; read ones are never
+        # looked up this way
+        Index("ix_notification_user_unread", "user_id", "created_at", postgresql_where=text("is_read = false")),
+    )
 
     # Primary key
-    id = Column(Integer, primary_key=True, index=True, doc="Unique notification ID")
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, doc="Unique notification ID")
     
     # Notification classification and content
-    type = Column(String(50), nullable=False,
-                 doc="Type of notification (warranty_expiry, idle_asset, etc.)")
-    title = Column(String(200), nullable=False, doc="Short notification title")
-    message = Column(Text, nullable=False, doc="Full notification message")
+    type: Mapped[str] = mapped_column(String(50), nullable=False,
+                                     doc="Type of notification (warranty_expiry, idle_asset, etc.)")
+    title: Mapped[str] = mapped_column(String(200), nullable=False, doc="Short notification title")
+    message: Mapped[str] = mapped_column(Text, nullable=False, doc="Full notification message")
     
     # Related entities (optional)
-    asset_id = Column(Integer, ForeignKey("assets.id"), nullable=True,
-                     doc="Associated asset ID (if asset-related notification)")
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=True,
-                    doc="Target user ID (if user-specific notification)")
+    asset_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("assets.id", ondelete="SET NULL"), nullable=True, index=True,
+                                                   doc="Associated asset ID (if asset-related notification)")
+    user_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("users.id"), nullable=True, index=True,
+                                                  doc="Target user ID (if user-specific notification)")
     
     # Notification state
-    is_read = Column(Boolean, default=False, doc="Whether notification has been read")
+    is_read: Mapped[Optional[bool]] = mapped_column(Boolean, default=False, doc="Whether notification has been read")
     
     # Audit timestamp
-    created_at = Column(DateTime, default=datetime.utcnow,
-                       doc="Timestamp when notification was created")
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow(),
+                                                          doc="Timestamp when notification was created")
 
     # Relationships
-    asset = relationship("Asset", doc="Associated asset (if applicable)")
-    user = relationship("User", doc="Target user (if applicable)")
+    asset: Mapped[Optional["Asset"]] = relationship("Asset", lazy="raise", doc="Associated asset (if applicable)")
+    user: Mapped[Optional["User"]] = relationship("User", lazy="raise", doc="Target user (if applicable)")
 
 
 class AuditLog(Base):
@@ -278,67 +377,76 @@ class AuditLog(Base):
     - Bulk operations
     """
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        # Audit trail of one actor / one resource (e.g. asset LAP-001) / one
+        # kind of action. The trailing timestamp serves the newest-first
+        # ordering of those lookups without a separate sort.
+        Index("ix_audit_user_ts", "user_id", "timestamp"),
+        Index("ix_audit_resource_ts", "resource_type", "resource_id", "timestamp"),
+        Index("ix_audit_action_ts", "action", "timestamp"),
+    )
 
     # Primary key
-    id = Column(Integer, primary_key=True, index=True, doc="Unique audit log entry ID")
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, doc="Unique audit log entry ID")
     
     # Action classification
-    action = Column(String(100), nullable=False,
-                   doc="Type of action performed (create, update, delete, assign, status_change, sign_document, etc.)")
-    resource_type = Column(String(50), nullable=False,
-                          doc="Type of resource affected (asset, user, server, network_appliance, etc.)")
-    resource_id = Column(String(50), nullable=True,
-                        doc="ID of the affected resource (asset_id, user_id, etc.)")
-    resource_name = Column(String(200), nullable=True,
-                          doc="Human-readable name of the affected resource")
+    action: Mapped[str] = mapped_column(String(100), nullable=False,
+                                       doc="Type of action performed (create, update, delete, assign, status_change, sign_document, etc.)")
+    resource_type: Mapped[str] = mapped_column(String(50), nullable=False,
+                                              doc="Type of resource affected (asset, user, server, network_appliance, etc.)")
+    resource_id: Mapped[Optional[str]] = mapped_column(String(50), nullable=True,
+                                                      doc="ID of the affected resource (asset_id, user_id, etc.)")
+    resource_name: Mapped[Optional[str]] = mapped_column(String(200), nullable=True,
+                                                        doc="Human-readable name of the affected resource")
     
     # Actor information
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False,
-                    doc="ID of the user who performed the action")
-    user_name = Column(String(100), nullable=False,
-                      doc="Name of user at time of action (for historical reference)")
-    user_role = Column(String(20), nullable=False,
-                      doc="Role of user at time of action")
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False,
+                                        doc="ID of the user who performed the action")
+    user_name: Mapped[str] = mapped_column(String(100), nullable=False,
+                                          doc="Name of user at time of action (for historical reference)")
+    user_role: Mapped[str] = mapped_column(String(20), nullable=False,
+                                          doc="Role of user at time of action")
     
     # Action details and context
-    description = Column(Text, nullable=False,
-                        doc="Human-readable description of the action")
-    details = Column(Text, nullable=True,
-                    doc="Additional details or metadata (JSON format)")
-    old_values = Column(Text, nullable=True,
-                       doc="Previous values before change (JSON format)")
-    new_values = Column(Text, nullable=True,
-                       doc="New values after change (JSON format)")
+    description: Mapped[str] = mapped_column(Text, nullable=False,
+                                            doc="Human-readable description of the action")
+    details: Mapped[Optional[str]] = mapped_column(Text, nullable=True,
+                                                  doc="Additional human-readable details (e.g. the list of changed fields)")
+    old_values: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True,
+                                                      doc="Previous values of the changed fields")
+    new_values: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True,
+                                                      doc="New values of the changed fields")
     
     # Asset-specific tracking (for asset-related actions)
-    asset_id = Column(Integer, ForeignKey("assets.id"), nullable=True,
-                     doc="Related asset database ID (if applicable)")
-    asset_identifier = Column(String(50), nullable=True,
-                             doc="Asset identifier at time of action (e.g., LAP-001)")
+    # SET NULL: entries outlive a deleted asset and keep asset_identifier
+    asset_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("assets.id", ondelete="SET NULL"), nullable=True, index=True,
+                                                   doc="Related asset database ID (if applicable)")
+    asset_identifier: Mapped[Optional[str]] = mapped_column(String(50), nullable=True,
+                                                           doc="Asset identifier at time of action (e.g., LAP-001)")
     
     # IP and session tracking
-    ip_address = Column(String(45), nullable=True,
-                       doc="IP address of user performing action")
-    user_agent = Column(String(500), nullable=True,
-                       doc="Browser/client user agent")
+    ip_address: Mapped[Optional[str]] = mapped_column(INET, nullable=True,
+                                                     doc="IP address of user performing action")
+    user_agent: Mapped[Optional[str]] = mapped_column(String(500), nullable=True, deferred=True,
+                                                     doc="Browser/client user agent (not loaded until accessed)")
     
     # Timestamps
-    timestamp = Column(DateTime, default=datetime.utcnow,
-                      doc="When the action occurred")
+    timestamp: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow(), index=True,
+                                                         doc="When the action occurred")
 
     # Relationships
-    user = relationship("User", doc="User who performed the action")
-    asset = relationship("Asset", doc="Asset related to this action (if applicable)")
+    user: Mapped["User"] = relationship("User", lazy="raise", doc="User who performed the action")
+    asset: Mapped[Optional["Asset"]] = relationship("Asset", lazy="raise", doc="Asset related to this action (if applicable)")
 
 
-class DocumentType(enum.Enum):
+class DocumentType(enum.StrEnum):
     """Document types for electronic signature workflow"""
     DECLARATION_FORM = "declaration_form"  # P14-Form 2
     IT_ORIENTATION = "it_orientation"      # P14-Form 3  
     HANDOVER_FORM = "handover_form"        # P14-Form 1
 
 
-class DocumentStatus(enum.Enum):
+class DocumentStatus(enum.StrEnum):
     """Document signing status"""
     PENDING = "pending"
     SIGNED = "signed"
@@ -354,27 +462,36 @@ class AssetDocument(Base):
     including declaration forms, IT orientation forms, and handover forms.
     """
     __tablename__ = "asset_documents"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    asset_id = Column(Integer, ForeignKey("assets.id"), nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    document_type = Column(SQLEnum(DocumentType), nullable=False)
-    status = Column(SQLEnum(DocumentStatus), default=DocumentStatus.PENDING)
-    
-    # Document content and metadata
-    document_data = Column(Text)  # JSON data for form fields
-    signature_data = Column(Text)  # Base64 encoded signature
-    ip_address = Column(String(45))
-    user_agent = Column(String(500))
+    __table_args__ = (
+        # Supports the "pending documents for this user" lookups; status alone
+        # has only four values and would not be selective enough
+        Index("ix_asset_documents_user_status", "user_id", "status"),
+    )
+    
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    asset_id: Mapped[int] = mapped_column(Integer, ForeignKey("assets.id", ondelete="RESTRICT"), nullable=False, index=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
+    document_type: Mapped[DocumentType] = mapped_column(SQLEnum(DocumentType, values_callable=_enum_values), nullable=False)
+    status: Mapped[Optional[DocumentStatus]] = mapped_column(SQLEnum(DocumentStatus, values_callable=_enum_values), default=DocumentStatus.PENDING)
+    
+    # Document content and metadata. The bulky columns are deferred: document
+    # lists never show them, so they are only loaded when accessed on a row
+    document_data: Mapped[Optional[dict]] = mapped_column(JSONB, deferred=True)  # Form field values
+    signature_data: Mapped[Optional[bytes]] = mapped_column(LargeBinary, deferred=True)  # Raw signature image bytes
+    ip_address: Mapped[Optional[str]] = mapped_column(String(45))
+    user_agent: Mapped[Optional[str]] = mapped_column(String(500), deferred=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    signed_at = Column(DateTime)
-    expires_at = Column(DateTime)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow())
+    signed_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    
+    # Fetch created_at through RETURNING on INSERT
+    __mapper_args__ = {"eager_defaults": True}
     
     # Relationships
-    asset = relationship("Asset")
-    user = relationship("User")
+    asset: Mapped["Asset"] = relationship("Asset", lazy="raise")
+    user: Mapped["User"] = relationship("User", lazy="raise")
 
 
 class DocumentTemplate(Base):
@@ -386,13 +503,13 @@ class DocumentTemplate(Base):
     """
     __tablename__ = "document_templates"
     
-    id = Column(Integer, primary_key=True, index=True)
-    document_type = Column(SQLEnum(DocumentType), unique=True, nullable=False)
-    template_name = Column(String(200), nullable=False)
-    template_content = Column(Text, nullable=False)  # HTML template
-    fields_schema = Column(Text, nullable=False)     # JSON schema for form fields
-    is_active = Column(Boolean, default=True)
-    version = Column(String(10), default="1.0")
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    document_type: Mapped[DocumentType] = mapped_column(SQLEnum(DocumentType, values_callable=_enum_values), unique=True, nullable=False)
+    template_name: Mapped[str] = mapped_column(String(200), nullable=False)
+    template_content: Mapped[str] = mapped_column(Text, nullable=False)  # HTML template
+    fields_schema: Mapped[list] = mapped_column(JSONB, nullable=False)    # JSON schema for form fields
+    is_active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
+    version: Mapped[Optional[str]] = mapped_column(String(10), default="1.0")
     
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
\ No newline at end of file
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=utcnow(), onupdate=utcnow())
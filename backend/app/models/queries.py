@@ -0,0 +1,70 @@
+"""
+Prebuilt SQL statements for the hottest read paths.
+
+Each statement is constructed once at import time with bound parameters for
+the values that change per request, instead of rebuilding the same query
+object on every call. Routers execute them through the session, passing the
+parameter values:
+
+    user = db.scalars(USER_BY_USERNAME, {"username": username}).first()
+
+Because the statement objects are reused, their cache key is computed against
+an unchanging structure and the compiled SQL is served from the engine's
+statement cache.
+"""
+
+from sqlalchemy import bindparam, func, select, tuple_
+
+from .models import Asset, User
+
+# ================================
+# USERS
+# ================================
+
+USER_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+"""User matching :username; used by login and by every authenticated request."""
+
+# ================================
+# ASSETS
+# ================================
+
+ASSET_ID_TAKEN = select(Asset.id).where(Asset.asset_id == bindparam("asset_id"))
+"""Database ID of the asset using identifier :asset_id, if any (uniqueness checks)."""
+
+# ================================
+# DASHBOARD
+# ================================
+
+USER_ASSET_TYPES = ("laptop", "desktop", "tablet")
+"""Asset types that are issued out to users and appear in the dashboard charts."""
+
+_is_user_asset = Asset.type.in_(USER_ASSET_TYPES)
+
+# Values of GROUPING(status, type, department) identifying which grouping
+# set a row of ASSET_DASHBOARD_TOTALS belongs to (a set bit means the column
+# is not grouped in that row)
+BY_STATUS, BY_TYPE, BY_DEPARTMENT, OVERALL = 0b011, 0b101, 0b110, 0b111
+
+ASSET_DASHBOARD_TOTALS = (
+    select(
+        func.grouping(Asset.status, Asset.type, Asset.department),
+        Asset.status,
+        Asset.type,
+        Asset.department,
+        func.count(Asset.id),
+        func.count(Asset.id).filter(_is_user_asset),
+        func.coalesce(func.sum(Asset.purchase_cost).filter(_is_user_asset), 0),
+    )
+    .group_by(
+        func.grouping_sets(
+            tuple_(Asset.status), tuple_(Asset.type), tuple_(Asset.department), tuple_()
+        )
+    )
+)
+"""
+Every dashboard breakdown in one scan of assets, using GROUPING SETS.
+
+Rows are (grouping, status, type, department, all assets, user assets,
+user asset purchase cost); grouping is one of BY_STATUS, BY_TYPE,
+BY_DEPARTMENT or OVERALL.
+"""
@@ -34,18 +34,30 @@ Version: 1.0.0
 Created: 2024
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Response, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response, UploadFile, File
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func, extract, and_, or_
-from typing import List, Optional
+from sqlalchemy import Integer, String, cast, func, extract, and_, or_, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from typing import List, Optional, Tuple
 from datetime import datetime, timedelta
+from decimal import Decimal, InvalidOperation
 import csv
+import hashlib
 import io
+import orjson
+import time
 
-from app.core.database import get_db
+from app.core.cache import ASSET_COUNTS_KEY, DASHBOARD_PAYLOAD_KEY, IDLE_ASSETS_KEY, WARRANTY_ALERTS_KEY, get_or_compute, invalidate_dashboard_cache
+from app.core.config import settings
+from app.core.database import SessionLocal, get_db
+from app.models.base import utcnow
 from app.models.models import Asset, AssetIssuance, AssetStatus, User, UserRole, Notification, AssetDocument, DocumentType, DocumentStatus, AuditLog
+from app.models.queries import ASSET_DASHBOARD_TOTALS, ASSET_ID_TAKEN, BY_DEPARTMENT, BY_STATUS, BY_TYPE
 from .auth import get_current_user
-from pydantic import BaseModel
+from .documents import decode_signature
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from typing import Dict, Any
 import json
 
@@ -65,7 +77,6 @@ def get_system_user(db: Session):
         )
         db.add(system_user)
         db.commit()
-        db.refresh(system_user)
     return system_user
 
 router = APIRouter(
@@ -73,6 +84,27 @@ router = APIRouter(
     tags=["assets"]
 )
 
+# Number of assets fetched and written per chunk of the CSV export
+EXPORT_BATCH_SIZE = 1000
+
+# Header line of the CSV export, in the csv module's default dialect
+EXPORT_CSV_HEADER = ",".join([
+    'Asset ID', 'Type', 'Brand', 'Model', 'Serial Number',
+    'Department', 'Location', 'Status', 'Assigned User',
+    'Purchase Date', 'Warranty Expiry', 'Purchase Cost',
+    'Condition', 'Notes', 'Created At'
+]) + "\r\n"
+
+# Number of imported servers sent per batched INSERT
+IMPORT_BATCH_SIZE = 500
+
+# Unique index on assets.asset_id, reported by duplicate-ID IntegrityErrors
+ASSET_ID_UNIQUE_INDEX = "ix_assets_asset_id"
+
+# Foreign keys that keep issued assets from being deleted (ON DELETE RESTRICT)
+ASSET_ISSUANCES_FK = "asset_issuances_asset_id_fkey"
+ASSET_DOCUMENTS_FK = "asset_documents_asset_id_fkey"
+
 
 
 def log_audit_action(
@@ -86,8 +118,8 @@ def log_audit_action(
     user_role: str,
     description: str,
     details: Optional[str] = None,
-    old_values: Optional[str] = None,
-    new_values: Optional[str] = None,
+    old_values: Optional[Dict[str, Any]] = None,
+    new_values: Optional[Dict[str, Any]] = None,
     asset_id: Optional[int] = None,
     asset_identifier: Optional[str] = None,
     ip_address: Optional[str] = None,
@@ -120,6 +152,26 @@ def log_audit_action(
     db.commit()
     return audit_log
 
+def _violates(error: IntegrityError, constraint_name: str) -> bool:
+    """Whether an IntegrityError was raised by the named constraint or unique index"""
+    diag = getattr(error.orig, "diag", None)
+    return diag is not None and diag.constraint_name == constraint_name
+
+def _parse_purchase_cost(value: Optional[str]) -> Optional[Decimal]:
+    """
+    Parse a purchase cost from a CSV cell.
+    
+    Thousands separators and a leading currency symbol are ignored; an empty
+    cell means no cost was recorded.
+    """
+    value = (value or "").strip().lstrip("$").replace(",", "")
+    if not value:
+        return None
+    try:
+        return Decimal(value)
+    except InvalidOperation:
+        raise ValueError(f"Invalid purchase cost '{value}'")
+
 # Pydantic models
 class AssetBase(BaseModel):
     asset_id: str
@@ -132,7 +184,7 @@ class AssetBase(BaseModel):
     location: Optional[str] = None
     purchase_date: datetime
     warranty_expiry: datetime
-    purchase_cost: Optional[str] = None
+    purchase_cost: Optional[Decimal] = None
     condition: str = "Good"
     notes: Optional[str] = None
     os: Optional[str] = None
@@ -152,7 +204,7 @@ class AssetUpdate(BaseModel):
     location: Optional[str] = None
     purchase_date: Optional[datetime] = None
     warranty_expiry: Optional[datetime] = None
-    purchase_cost: Optional[str] = None
+    purchase_cost: Optional[Decimal] = None
     condition: Optional[str] = None
     notes: Optional[str] = None
     status: Optional[str] = None
@@ -167,8 +219,7 @@ class AssetResponse(AssetBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class AssetIssuanceCreate(BaseModel):
     user_id: int
@@ -187,8 +238,13 @@ class AssetIssuanceResponse(BaseModel):
     notes: Optional[str]
     issued_by: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+def _issuance_response(issuance: AssetIssuance, user_name: str) -> AssetIssuanceResponse:
+    """Build an issuance response from the ORM row, with the user name
+    attached to the row (it comes from a join, not a mapped column)"""
+    issuance.user_name = user_name
+    return AssetIssuanceResponse.model_validate(issuance)
 
 class AuditLogResponse(BaseModel):
     id: int
@@ -203,8 +259,30 @@ class AuditLogResponse(BaseModel):
     asset_identifier: Optional[str]
     timestamp: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+# List validators, built once at import. Validating a whole list of ORM rows
+# in one call stays inside pydantic-core instead of one model_validate per row.
+ASSET_LIST_ADAPTER = TypeAdapter(List[AssetResponse])
+ISSUANCE_LIST_ADAPTER = TypeAdapter(List[AssetIssuanceResponse])
+AUDIT_LOG_LIST_ADAPTER = TypeAdapter(List[AuditLogResponse])
+
+# The asset columns an AssetResponse is built from. List endpoints select
+# these as plain rows, which skips building (and identity-mapping) an Asset
+# object per row; the rows validate by attribute like the ORM objects do.
+ASSET_RESPONSE_COLUMNS = tuple(getattr(Asset, name) for name in AssetResponse.model_fields)
+
+def _asset_responses(assets) -> List[AssetResponse]:
+    """Build responses for a list of assets or ASSET_RESPONSE_COLUMNS rows"""
+    return ASSET_LIST_ADAPTER.validate_python(assets, from_attributes=True)
+
+def _issuance_responses(rows) -> List[AssetIssuanceResponse]:
+    """Build responses for (AssetIssuance, user name) rows"""
+    issuances = []
+    for issuance, user_name in rows:
+        issuance.user_name = user_name
+        issuances.append(issuance)
+    return ISSUANCE_LIST_ADAPTER.validate_python(issuances, from_attributes=True)
 
 class DocumentSignRequest(BaseModel):
     signature_data: str  # Base64 encoded signature
@@ -225,28 +303,34 @@ class DashboardData(BaseModel):
     assets_by_status: Dict[str, int]
     assets_by_type: Dict[str, int]
     assets_by_department: Dict[str, int]
+    cost_by_department: Dict[str, Decimal] = {}
     recent_issuances: List[AssetIssuanceResponse]
     recent_activities: List[AuditLogResponse]  # Add recent activities
     warranty_alerts: List[AssetResponse]
     idle_assets: List[AssetResponse]
 
-# Dashboard endpoint
-@router.get("/dashboard", response_model=DashboardData)
-def get_dashboard_data(db: Session = Depends(get_db)):
-    """Get comprehensive dashboard data for all assets including servers and network appliances"""
-    
-    # User assets that can be issued out
-    user_asset_types = ['laptop', 'desktop', 'tablet']
-    user_assets_filter = Asset.type.in_(user_asset_types)
-    
-    # Total user assets only (for status chart)
-    total_assets = db.query(Asset).filter(user_assets_filter).count()
-    
-    # Assets by status (user assets only for the status chart)
-    status_counts = db.query(
-        Asset.status, func.count(Asset.id)
-    ).filter(user_assets_filter).group_by(Asset.status).all()
-    assets_by_status = {status.value: count for status, count in status_counts}
+def _compute_asset_counts(db: Session) -> Dict[str, Any]:
+    """Asset totals and breakdowns for the dashboard charts"""
+    # Status, department and total cover user assets only (status chart);
+    # types cover ALL assets including servers and network appliances.
+    # All of them come from a single GROUPING SETS query.
+    total_assets = 0
+    assets_by_status = {}
+    assets_by_type = {}
+    assets_by_department = {}
+    cost_by_department = {}
+    for grouping, status, asset_type, dept, count, user_count, user_cost in db.execute(ASSET_DASHBOARD_TOTALS):
+        if grouping == BY_STATUS:
+            if user_count:
+                assets_by_status[status] = user_count
+        elif grouping == BY_TYPE:
+            assets_by_type[asset_type.upper()] = count
+        elif grouping == BY_DEPARTMENT:
+            if user_count:
+                assets_by_department[dept] = user_count
+                cost_by_department[dept] = user_cost
+        else:
+            total_assets = user_count
     
     # Ensure all status types are included, even if count is 0
     all_statuses = ['available', 'pending_for_signature', 'in_use', 'maintenance', 'retired']
@@ -254,17 +338,111 @@ def get_dashboard_data(db: Session = Depends(get_db)):
         if status not in assets_by_status:
             assets_by_status[status] = 0
     
-    # Assets by type (ALL asset types including servers and network appliances)
-    type_counts = db.query(
-        Asset.type, func.count(Asset.id)
-    ).group_by(Asset.type).all()
-    assets_by_type = {asset_type.upper(): count for asset_type, count in type_counts}
+    return {
+        "total_assets": total_assets,
+        "assets_by_status": assets_by_status,
+        "assets_by_type": assets_by_type,
+        "assets_by_department": assets_by_department,
+        "cost_by_department": cost_by_department,
+    }
+
+def _compute_warranty_alerts(db: Session) -> List[Dict[str, Any]]:
+    """Serialized assets whose warranty expires within the next 30 days"""
+    warranty_alerts_query = db.query(*ASSET_RESPONSE_COLUMNS).filter(
+        and_(
+            Asset.warranty_expiry <= utcnow() + timedelta(days=30),
+            Asset.warranty_expiry >= utcnow(),
+            Asset.status != AssetStatus.RETIRED  # matches ix_asset_warranty_soon
+        )
+    ).order_by(Asset.warranty_expiry.asc()).limit(10).all()
+    
+    return ASSET_LIST_ADAPTER.dump_python(_asset_responses(warranty_alerts_query))
+
+def _compute_idle_assets(db: Session) -> List[Dict[str, Any]]:
+    """Serialized assets in use that have not been updated for 30 days"""
+    idle_assets_query = db.query(*ASSET_RESPONSE_COLUMNS).filter(
+        and_(
+            Asset.status == AssetStatus.IN_USE,
+            Asset.updated_at <= utcnow() - timedelta(days=30)  # matches ix_asset_idle
+        )
+    ).limit(10).all()
     
-    # Assets by department (user assets only)
-    dept_counts = db.query(
-        Asset.department, func.count(Asset.id)
-    ).filter(user_assets_filter).group_by(Asset.department).all()
-    assets_by_department = {dept: count for dept, count in dept_counts}
+    return ASSET_LIST_ADAPTER.dump_python(_asset_responses(idle_assets_query))
+
+# Monotonic time of the last dashboard request served by this process; the
+# background refresh pauses while the dashboard is not being polled
+_last_dashboard_request = 0.0
+
+# Dashboard endpoint
+@router.get("/dashboard", response_model=DashboardData)
+def get_dashboard_data(request: Request, response: Response, db: Session = Depends(get_db)):
+    """Get comprehensive dashboard data for all assets including servers and network appliances"""
+    
+    # Clients poll the dashboard every few seconds, so the whole response is
+    # shared between them for DASHBOARD_PAYLOAD_CACHE_SECONDS. It is cached
+    # already serialized, with its ETag: a poll that already has this payload
+    # gets a bare 304, and any other hit skips response-model validation and
+    # JSON encoding.
+    global _last_dashboard_request
+    _last_dashboard_request = time.monotonic()
+    etag, body = get_or_compute(
+        DASHBOARD_PAYLOAD_KEY,
+        lambda: _serialize_payload(_compute_dashboard_data(db)),
+        expiration_time=settings.DASHBOARD_PAYLOAD_CACHE_SECONDS
+    )
+    not_modified = _not_modified(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+    return Response(content=body, media_type="application/json", headers=response.headers)
+
+def refresh_dashboard_cache(max_age: int) -> None:
+    """
+    Recompute the cached dashboard if it is older than max_age seconds (pre-warm).
+    
+    This goes through the cache's dogpile lock, which the Redis backend shares
+    between workers: one process recomputes a due payload while the others
+    keep serving the current one.
+    """
+    db = SessionLocal()
+    try:
+        get_or_compute(
+            DASHBOARD_PAYLOAD_KEY,
+            lambda: _serialize_payload(_compute_dashboard_data(db)),
+            expiration_time=max_age
+        )
+    finally:
+        db.close()
+
+def dashboard_idle_seconds() -> float:
+    """Seconds since this process last served the dashboard"""
+    return time.monotonic() - _last_dashboard_request
+
+def _serialize_payload(payload: Dict[str, Any]) -> Tuple[str, bytes]:
+    """Encode a JSON-compatible payload and pair it with an ETag of its content"""
+    body = orjson.dumps(payload)
+    return f'"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"', body
+
+def _not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """
+    Return a 304 response if the client already holds this ETag.
+    
+    Otherwise set the ETag on the outgoing response and return None. Clients
+    must revalidate every time (no-cache), so a write is never masked.
+    """
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
+
+def _compute_dashboard_data(db: Session) -> Dict[str, Any]:
+    """Build the dashboard response as plain JSON-compatible data, validated
+    against DashboardData once here rather than on every cached response"""
+    
+    # Asset counts only change when assets are written, so they are served
+    # from the dashboard cache, which the write endpoints clear
+    counts = get_or_compute(ASSET_COUNTS_KEY, lambda: _compute_asset_counts(db))
     
     # Recent issuances (last 10)
     recent_issuances_query = db.query(AssetIssuance, User.full_name).join(
@@ -273,69 +451,33 @@ def get_dashboard_data(db: Session = Depends(get_db)):
         AssetIssuance.return_date.is_(None)
     ).order_by(AssetIssuance.issued_date.desc()).limit(10).all()
     
-    recent_issuances = []
-    for issuance, user_name in recent_issuances_query:
-        recent_issuances.append(AssetIssuanceResponse(
-            id=issuance.id,
-            asset_id=issuance.asset_id,
-            user_id=issuance.user_id,
-            user_name=user_name,
-            issued_date=issuance.issued_date,
-            expected_return_date=issuance.expected_return_date,
-            return_date=issuance.return_date,
-            notes=issuance.notes,
-            issued_by=issuance.issued_by
-        ))
-    
-    # Warranty alerts (assets expiring in next 30 days)
-    thirty_days_from_now = datetime.utcnow() + timedelta(days=30)
-    warranty_alerts_query = db.query(Asset).filter(
-        and_(
-            Asset.warranty_expiry <= thirty_days_from_now,
-            Asset.warranty_expiry >= datetime.utcnow(),
-            Asset.status != AssetStatus.RETIRED
-        )
-    ).order_by(Asset.warranty_expiry.asc()).limit(10).all()
-    
-    warranty_alerts = []
-    for asset in warranty_alerts_query:
-        asset_response = AssetResponse.from_orm(asset)
-        if asset.assigned_user_id:
-            user = db.query(User).filter(User.id == asset.assigned_user_id).first()
-            asset_response.assigned_user_name = user.full_name if user else None
-        warranty_alerts.append(asset_response)
-    
-    # Idle assets (in use for more than 30 days without activity)
-    thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-    idle_assets_query = db.query(Asset).filter(
-        and_(
-            Asset.status == AssetStatus.IN_USE,
-            Asset.updated_at <= thirty_days_ago
-        )
-    ).limit(10).all()
+    recent_issuances = _issuance_responses(recent_issuances_query)
     
-    idle_assets = []
-    for asset in idle_assets_query:
-        asset_response = AssetResponse.from_orm(asset)
-        if asset.assigned_user_id:
-            user = db.query(User).filter(User.id == asset.assigned_user_id).first()
-            asset_response.assigned_user_name = user.full_name if user else None
-        idle_assets.append(asset_response)
+    # Warranty alerts (assets expiring in next 30 days) and idle assets (in
+    # use for more than 30 days without activity) also change as time passes,
+    # but only across day-scale thresholds: they are cached for
+    # DASHBOARD_ALERTS_CACHE_SECONDS instead of being recomputed with every
+    # payload
+    warranty_alerts = get_or_compute(
+        WARRANTY_ALERTS_KEY, lambda: _compute_warranty_alerts(db),
+        expiration_time=settings.DASHBOARD_ALERTS_CACHE_SECONDS
+    )
+    idle_assets = get_or_compute(
+        IDLE_ASSETS_KEY, lambda: _compute_idle_assets(db),
+        expiration_time=settings.DASHBOARD_ALERTS_CACHE_SECONDS
+    )
     
     # Recent activities (last 10 audit logs)
     recent_activities_query = db.query(AuditLog).order_by(AuditLog.timestamp.desc()).limit(10).all()
-    recent_activities = [AuditLogResponse.from_orm(activity) for activity in recent_activities_query]
+    recent_activities = AUDIT_LOG_LIST_ADAPTER.validate_python(recent_activities_query, from_attributes=True)
     
     return DashboardData(
-        total_assets=total_assets,
-        assets_by_status=assets_by_status,
-        assets_by_type=assets_by_type,
-        assets_by_department=assets_by_department,
+        **counts,
         recent_issuances=recent_issuances,
         recent_activities=recent_activities,
         warranty_alerts=warranty_alerts,
         idle_assets=idle_assets
-    )
+    ).model_dump(mode="json")
 
 # Audit log endpoints
 @router.get("/audit-logs", response_model=List[AuditLogResponse])
@@ -355,25 +497,28 @@ def get_audit_logs(
         query = query.filter(AuditLog.action == action)
     
     audit_logs = query.order_by(AuditLog.timestamp.desc()).offset(offset).limit(limit).all()
-    return [AuditLogResponse.from_orm(log) for log in audit_logs]
+    return AUDIT_LOG_LIST_ADAPTER.validate_python(audit_logs, from_attributes=True)
 
 @router.get("/pending-signature", response_model=List[Dict[str, Any]])
 def get_pending_signature_assets(db: Session = Depends(get_db)):
     """Get assets that are pending signature with time information"""
-    assets = db.query(Asset).filter(Asset.status == AssetStatus.PENDING_FOR_SIGNATURE).all()
+    assets = db.query(Asset).filter(
+        Asset.status == AssetStatus.PENDING_FOR_SIGNATURE
+    ).all()
+    
+    # Latest open issuance per asset, fetched for all assets at once; ordering
+    # oldest first lets the newest overwrite earlier ones in the dict
+    open_issuances = db.query(AssetIssuance).filter(
+        and_(
+            AssetIssuance.asset_id.in_([asset.id for asset in assets]),
+            AssetIssuance.return_date.is_(None)
+        )
+    ).order_by(AssetIssuance.issued_date.asc()).all()
+    latest_issuance = {issuance.asset_id: issuance for issuance in open_issuances}
     
     result = []
     for asset in assets:
-        # Get the user assigned to this asset
-        user = db.query(User).filter(User.id == asset.assigned_user_id).first()
-        
-        # Get the latest issuance record to find when it was assigned
-        issuance = db.query(AssetIssuance).filter(
-            and_(
-                AssetIssuance.asset_id == asset.id,
-                AssetIssuance.return_date.is_(None)
-            )
-        ).order_by(AssetIssuance.issued_date.desc()).first()
+        issuance = latest_issuance.get(asset.id)
         
         # Calculate days pending
         days_pending = 0
@@ -384,7 +529,7 @@ def get_pending_signature_assets(db: Session = Depends(get_db)):
             "id": asset.id,
             "asset_id": asset.asset_id,
             "asset_name": f"{asset.brand} {asset.model}",
-            "user_name": user.full_name if user else "Unknown",
+            "user_name": asset.assigned_user_name or "Unknown",
             "user_id": asset.assigned_user_id,
             "assigned_date": issuance.issued_date.isoformat() if issuance else None,
             "days_pending": days_pending,
@@ -401,18 +546,21 @@ def create_asset(
     db: Session = Depends(get_db)
 ):
     """Create a new asset"""
-    # Check if asset_id already exists
-    existing_asset = db.query(Asset).filter(Asset.asset_id == asset.asset_id).first()
-    if existing_asset:
+    # A single INSERT ... ON CONFLICT DO NOTHING RETURNING both checks the
+    # unique asset_id and loads the new row, with no check-then-insert race
+    db_asset = db.scalars(
+        pg_insert(Asset)
+        .values(**asset.model_dump())
+        .on_conflict_do_nothing(index_elements=[Asset.asset_id])
+        .returning(Asset)
+    ).first()
+    if db_asset is None:
         raise HTTPException(
             status_code=400,
             detail="Asset ID already exists"
         )
-    
-    db_asset = Asset(**asset.model_dump())
-    db.add(db_asset)
     db.commit()
-    db.refresh(db_asset)
+    invalidate_dashboard_cache()
     
     # Get user for audit logging (use system user if not authenticated)
     audit_user = get_system_user(db)
@@ -426,22 +574,22 @@ def create_asset(
         resource_name=f"{db_asset.brand} {db_asset.model}",
         user_id=audit_user.id,
         user_name=audit_user.full_name,
-        user_role=audit_user.role.value,
+        user_role=audit_user.role,
         description=f"Asset {db_asset.asset_id} created",
-        details=f"Type: {db_asset.type}, Status: {db_asset.status.value}, Department: {db_asset.department}",
-        new_values=json.dumps({
+        details=f"Type: {db_asset.type}, Status: {db_asset.status}, Department: {db_asset.department}",
+        new_values={
             "asset_id": db_asset.asset_id,
             "type": db_asset.type,
             "brand": db_asset.brand,
             "model": db_asset.model,
-            "status": db_asset.status.value,
+            "status": db_asset.status,
             "department": db_asset.department
-        }),
+        },
         asset_id=db_asset.id,
         asset_identifier=db_asset.asset_id
     )
     
-    asset_response = AssetResponse.from_orm(db_asset)
+    asset_response = AssetResponse.model_validate(db_asset)
     return asset_response
 
 @router.get("/", response_model=List[AssetResponse])
@@ -456,7 +604,7 @@ def get_assets(
     db: Session = Depends(get_db)
 ):
     """Get assets with filtering and pagination"""
-    query = db.query(Asset)
+    query = db.query(*ASSET_RESPONSE_COLUMNS)
     
     # Apply filters (handle empty strings properly)
     if status and status.strip():
@@ -485,17 +633,7 @@ def get_assets(
         )
     
     assets = query.offset(skip).limit(limit).all()
-    
-    # Add assigned user names
-    result = []
-    for asset in assets:
-        asset_response = AssetResponse.from_orm(asset)
-        if asset.assigned_user_id:
-            user = db.query(User).filter(User.id == asset.assigned_user_id).first()
-            asset_response.assigned_user_name = user.full_name if user else None
-        result.append(asset_response)
-    
-    return result
+    return _asset_responses(assets)
 
 @router.get("/assigned-to/{user_id}", response_model=List[AssetResponse])
 def get_user_assigned_assets(
@@ -505,21 +643,14 @@ def get_user_assigned_assets(
 ):
     """Get all assets assigned to a specific user"""
     # Verify user exists
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
     # Get assets assigned to the user
-    assets = db.query(Asset).filter(Asset.assigned_user_id == user_id).all()
+    assets = db.query(*ASSET_RESPONSE_COLUMNS).filter(Asset.assigned_user_id == user_id).all()
     
-    # Convert to response format with user names
-    result = []
-    for asset in assets:
-        asset_response = AssetResponse.from_orm(asset)
-        asset_response.assigned_user_name = user.full_name
-        result.append(asset_response)
-    
-    return result
+    return _asset_responses(assets)
 
 @router.get("/user-types", response_model=List[AssetResponse])
 def get_user_type_assets(
@@ -533,7 +664,7 @@ def get_user_type_assets(
     """Get user assets (laptop, desktop, tablet) with filtering"""
     # Define user asset types
     user_asset_types = ['laptop', 'desktop', 'tablet']
-    query = db.query(Asset).filter(Asset.type.in_(user_asset_types))
+    query = db.query(*ASSET_RESPONSE_COLUMNS).filter(Asset.type.in_(user_asset_types))
     
     # Apply filters
     if status and status.strip():
@@ -556,31 +687,18 @@ def get_user_type_assets(
         )
     
     assets = query.offset(skip).limit(limit).all()
-    
-    # Add assigned user names
-    result = []
-    for asset in assets:
-        asset_response = AssetResponse.from_orm(asset)
-        if asset.assigned_user_id:
-            user = db.query(User).filter(User.id == asset.assigned_user_id).first()
-            asset_response.assigned_user_name = user.full_name if user else None
-        result.append(asset_response)
-    
-    return result
+    return _asset_responses(assets)
 
 @router.get("/{asset_id}", response_model=AssetResponse)
-def get_asset(asset_id: int, db: Session = Depends(get_db)):
+def get_asset(asset_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
     """Get a specific asset by ID"""
-    asset = db.query(Asset).filter(Asset.id == asset_id).first()
+    asset = db.get(Asset, asset_id)
     if asset is None:
         raise HTTPException(status_code=404, detail="Asset not found")
     
-    asset_response = AssetResponse.from_orm(asset)
-    if asset.assigned_user_id:
-        user = db.query(User).filter(User.id == asset.assigned_user_id).first()
-        asset_response.assigned_user_name = user.full_name if user else None
-    
-    return asset_response
+    # The row version changes on every update, so it identifies the response
+    etag = f'"asset-{asset.id}-{asset.version}"'
+    return _not_modified(request, response, etag) or AssetResponse.model_validate(asset)
 
 @router.put("/{asset_id}", response_model=AssetResponse)
 def update_asset(
@@ -592,7 +710,7 @@ def update_asset(
     """Update an asset"""
 
     
-    db_asset = db.query(Asset).filter(Asset.id == asset_id).first()
+    db_asset = db.get(Asset, asset_id)
     if db_asset is None:
         raise HTTPException(status_code=404, detail="Asset not found")
     
@@ -600,20 +718,7 @@ def update_asset(
     original_values = {}
     for key in asset_update.model_dump(exclude_unset=True).keys():
         if hasattr(db_asset, key):
-            original_value = getattr(db_asset, key)
-            if hasattr(original_value, 'value'):  # Handle enums
-                original_values[key] = original_value.value
-            else:
-                original_values[key] = original_value
-    
-    # Check if asset_id already exists (if being updated)
-    if asset_update.asset_id and asset_update.asset_id != db_asset.asset_id:
-        existing_asset = db.query(Asset).filter(Asset.asset_id == asset_update.asset_id).first()
-        if existing_asset:
-            raise HTTPException(
-                status_code=400,
-                detail="Asset ID already exists"
-            )
+            original_values[key] = getattr(db_asset, key)
     
     update_data = asset_update.model_dump(exclude_unset=True)
     new_values = {}
@@ -632,7 +737,18 @@ def update_asset(
             setattr(db_asset, key, value)
             new_values[key] = value
     
-    db_asset.updated_at = datetime.utcnow()
+    # A changed asset_id is checked by the unique index when the UPDATE is
+    # flushed rather than by a separate SELECT beforehand
+    try:
+        db.flush()
+    except IntegrityError as e:
+        db.rollback()
+        if _violates(e, ASSET_ID_UNIQUE_INDEX):
+            raise HTTPException(
+                status_code=400,
+                detail="Asset ID already exists"
+            )
+        raise
     
     # Log the asset update action - only log fields that actually changed
     changed_fields = []
@@ -670,24 +786,19 @@ def update_asset(
             resource_name=f"{db_asset.brand} {db_asset.model}",
             user_id=current_user.id,
             user_name=current_user.full_name,
-            user_role=current_user.role.value,
+            user_role=current_user.role,
             description=f"Asset {db_asset.asset_id} updated",
             details=f"{', '.join(changed_fields)}",
-            old_values=json.dumps(changed_old_values),  # Only changed fields
-            new_values=json.dumps(changed_new_values),  # Only changed fields
+            old_values=changed_old_values,  # Only changed fields
+            new_values=changed_new_values,  # Only changed fields
             asset_id=db_asset.id,
             asset_identifier=db_asset.asset_id
         )
     
     db.commit()
-    db.refresh(db_asset)
-    
-    asset_response = AssetResponse.from_orm(db_asset)
-    if db_asset.assigned_user_id:
-        user = db.query(User).filter(User.id == db_asset.assigned_user_id).first()
-        asset_response.assigned_user_name = user.full_name if user else None
+    invalidate_dashboard_cache()
     
-    return asset_response
+    return AssetResponse.model_validate(db_asset)
 
 @router.delete("/{asset_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_asset(
@@ -695,31 +806,17 @@ def delete_asset(
     db: Session = Depends(get_db)
 ):
     """Delete an asset"""
-    asset = db.query(Asset).filter(Asset.id == asset_id).first()
+    asset = db.get(Asset, asset_id)
     if asset is None:
         raise HTTPException(status_code=404, detail="Asset not found")
     
-    # Check if asset is currently issued
-    active_issuance = db.query(AssetIssuance).filter(
-        and_(
-            AssetIssuance.asset_id == asset_id,
-            AssetIssuance.return_date.is_(None)
-        )
-    ).first()
-    
-    if active_issuance:
-        raise HTTPException(
-            status_code=400,
-            detail="Cannot delete asset that is currently issued"
-        )
-    
     # Store essential asset info for audit logging before deletion
     asset_info = {
         "asset_id": asset.asset_id,
         "brand": asset.brand,
         "model": asset.model,
         "type": asset.type,
-        "status": asset.status.value if asset.status else None,
+        "status": asset.status,
         "department": asset.department,
         "location": asset.location
     }
@@ -727,7 +824,23 @@ def delete_asset(
     # Get user for audit logging (use system user if not authenticated)
     audit_user = get_system_user(db)
     
-    # Log the asset deletion action
+    # Issuance records and documents reference the asset with ON DELETE
+    # RESTRICT, so the DELETE itself fails for issued (or previously issued)
+    # assets and no separate check query is needed
+    db.delete(asset)
+    try:
+        db.flush()
+    except IntegrityError as e:
+        db.rollback()
+        if _violates(e, ASSET_ISSUANCES_FK) or _violates(e, ASSET_DOCUMENTS_FK):
+            raise HTTPException(
+                status_code=400,
+                detail="Cannot delete asset that is currently issued or has issuance history"
+            )
+        raise
+    
+    # Log the asset deletion action in the same transaction. The row is gone,
+    # so the entry refers to the asset by its identifier only
     log_audit_action(
         db=db,
         action="delete",
@@ -736,16 +849,13 @@ def delete_asset(
         resource_name=f"{asset.brand} {asset.model}",
         user_id=audit_user.id,
         user_name=audit_user.full_name,
-        user_role=audit_user.role.value,
+        user_role=audit_user.role,
         description=f"Asset {asset.asset_id} deleted",
         details=f"Deleted asset: {asset.asset_id} ({asset.brand} {asset.model})",
-        old_values=json.dumps(asset_info),
-        asset_id=asset.id,
+        old_values=asset_info,
         asset_identifier=asset.asset_id
     )
-    
-    db.delete(asset)
-    db.commit()
+    invalidate_dashboard_cache()
     return None
 
 # Asset issuance operations
@@ -757,21 +867,34 @@ def issue_asset(
     current_user: User = Depends(get_current_user)
 ):
     """Issue an asset to a user"""
-    asset = db.query(Asset).filter(Asset.id == asset_id).first()
-    if asset is None:
-        raise HTTPException(status_code=404, detail="Asset not found")
+    # Check if user exists
+    user = db.get(User, issuance.user_id)
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found")
     
-    if asset.status != AssetStatus.AVAILABLE:
+    # Assign the asset only if it is still available. The status check and
+    # the assignment are one conditional UPDATE ... RETURNING, so two
+    # concurrent requests cannot both issue the same asset.
+    asset = db.scalars(
+        update(Asset)
+        .where(Asset.id == asset_id, Asset.status == AssetStatus.AVAILABLE)
+        .values(
+            status=AssetStatus.PENDING_FOR_SIGNATURE,  # Asset is pending until documents are signed
+            assigned_user_id=user.id,
+            assigned_user_name=user.full_name,
+            department=user.department,  # Update department to user's department
+            version=Asset.version + 1
+        )
+        .returning(Asset)
+    ).first()
+    if asset is None:
+        if db.get(Asset, asset_id) is None:
+            raise HTTPException(status_code=404, detail="Asset not found")
         raise HTTPException(
             status_code=400,
             detail="Asset is not available for issuance"
         )
     
-    # Check if user exists
-    user = db.query(User).filter(User.id == issuance.user_id).first()
-    if user is None:
-        raise HTTPException(status_code=404, detail="User not found")
-    
     # Create issuance record
     db_issuance = AssetIssuance(
         asset_id=asset_id,
@@ -779,12 +902,6 @@ def issue_asset(
     )
     db.add(db_issuance)
     
-    # Update asset status to pending signature and assign user
-    asset.status = AssetStatus.PENDING_FOR_SIGNATURE  # Asset is pending until documents are signed
-    asset.assigned_user_id = issuance.user_id
-    asset.department = user.department  # Update department to user's department
-    asset.updated_at = datetime.utcnow()
-    
     # Create pending documents for electronic signature
     document_types = [
         DocumentType.DECLARATION_FORM,
@@ -792,20 +909,19 @@ def issue_asset(
         DocumentType.HANDOVER_FORM
     ]
     
-    for doc_type in document_types:
-        document = AssetDocument(
-            asset_id=asset_id,
-            user_id=issuance.user_id,
-            document_type=doc_type,
-            status=DocumentStatus.PENDING,
-            expires_at=datetime.utcnow() + timedelta(days=7)  # 7 days to sign
-        )
-        db.add(document)
-    
-    db.commit()
-    db.refresh(db_issuance)
+    expires_at = datetime.utcnow() + timedelta(days=7)  # 7 days to sign
+    db.execute(insert(AssetDocument), [
+        {
+            "asset_id": asset_id,
+            "user_id": issuance.user_id,
+            "document_type": doc_type,
+            "status": DocumentStatus.PENDING,
+            "expires_at": expires_at,
+        }
+        for doc_type in document_types
+    ])
     
-    # Log the asset issuance action
+    # Log the asset issuance action; this commits the whole issuance at once
     log_audit_action(
         db=db,
         action="assign",
@@ -814,29 +930,20 @@ def issue_asset(
         resource_name=f"{asset.brand} {asset.model}",
         user_id=current_user.id,  # Use actual current user
         user_name=current_user.full_name,  # Use actual current user name
-        user_role=current_user.role.value,  # Use actual current user role
+        user_role=current_user.role,  # Use actual current user role
         description=f"Asset {asset.asset_id} assigned to {user.full_name} (pending signature)",
         details=f"Asset type: {asset.type}, Expected return: {issuance.expected_return_date}",
         asset_id=asset.id,
         asset_identifier=asset.asset_id
     )
+    invalidate_dashboard_cache()
     
-    return AssetIssuanceResponse(
-        id=db_issuance.id,
-        asset_id=db_issuance.asset_id,
-        user_id=db_issuance.user_id,
-        user_name=user.full_name,
-        issued_date=db_issuance.issued_date,
-        expected_return_date=db_issuance.expected_return_date,
-        return_date=db_issuance.return_date,
-        notes=db_issuance.notes,
-        issued_by=db_issuance.issued_by
-    )
+    return _issuance_response(db_issuance, user.full_name)
 
 @router.post("/{asset_id}/return", response_model=AssetIssuanceResponse)
 def return_asset(asset_id: int, db: Session = Depends(get_db)):
     """Return an asset from a user"""
-    asset = db.query(Asset).filter(Asset.id == asset_id).first()
+    asset = db.get(Asset, asset_id)
     if asset is None:
         raise HTTPException(status_code=404, detail="Asset not found")
     
@@ -855,7 +962,7 @@ def return_asset(asset_id: int, db: Session = Depends(get_db)):
         )
     
     # Get user name
-    user = db.query(User).filter(User.id == issuance.user_id).first()
+    user = db.get(User, issuance.user_id)
     
     # Update issuance record
     issuance.return_date = datetime.utcnow()
@@ -863,23 +970,13 @@ def return_asset(asset_id: int, db: Session = Depends(get_db)):
     # Update asset status and reset department back to IT
     asset.status = AssetStatus.AVAILABLE
     asset.assigned_user_id = None
+    asset.assigned_user_name = None
     asset.department = "IT"  # Reset to IT department when returned
-    asset.updated_at = datetime.utcnow()
     
     db.commit()
-    db.refresh(issuance)
-    
-    return AssetIssuanceResponse(
-        id=issuance.id,
-        asset_id=issuance.asset_id,
-        user_id=issuance.user_id,
-        user_name=user.full_name if user else "Unknown",
-        issued_date=issuance.issued_date,
-        expected_return_date=issuance.expected_return_date,
-        return_date=issuance.return_date,
-        notes=issuance.notes,
-        issued_by=issuance.issued_by
-    )
+    invalidate_dashboard_cache()
+    
+    return _issuance_response(issuance, user.full_name if user else "Unknown")
 
 @router.post("/documents/{document_id}/sign", response_model=DocumentResponse)
 def sign_document(
@@ -889,7 +986,7 @@ def sign_document(
 ):
     """Sign a pending document for asset issuance"""
     # Get the document
-    document = db.query(AssetDocument).filter(AssetDocument.id == document_id).first()
+    document = db.get(AssetDocument, document_id)
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
     
@@ -904,13 +1001,17 @@ def sign_document(
     
     # Update document with signature
     document.status = DocumentStatus.SIGNED
-    document.signature_data = sign_request.signature_data
-    document.document_data = sign_request.document_data
+    document.signature_data = decode_signature(sign_request.signature_data)
+    if sign_request.document_data is not None:
+        try:
+            document.document_data = json.loads(sign_request.document_data)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="document_data must be valid JSON")
     document.signed_at = datetime.utcnow()
     
     # Get asset and user info for logging
-    asset = db.query(Asset).filter(Asset.id == document.asset_id).first()
-    user = db.query(User).filter(User.id == document.user_id).first()
+    asset = db.get(Asset, document.asset_id)
+    user = db.get(User, document.user_id)
     
     # Check if all documents for this asset issuance are now signed
     all_documents = db.query(AssetDocument).filter(
@@ -926,7 +1027,6 @@ def sign_document(
     if all_signed and asset:
         # All documents signed - transition asset to IN_USE
         asset.status = AssetStatus.IN_USE
-        asset.updated_at = datetime.utcnow()
         
         # Log the status change
         log_audit_action(
@@ -937,7 +1037,7 @@ def sign_document(
             resource_name=f"{asset.brand} {asset.model}",
             user_id=user.id if user else 1,
             user_name=user.full_name if user else "System",
-            user_role=user.role.value if user else "user",
+            user_role=user.role if user else "user",
             description=f"Asset {asset.asset_id} is now in use after all documents were signed by {user.full_name if user else 'user'}",
             details=f"All required documents signed for asset issuance",
             asset_id=asset.id,
@@ -950,23 +1050,23 @@ def sign_document(
         action="sign_document",
         resource_type="document",
         resource_id=str(document.id),
-        resource_name=f"{document.document_type.value} for {asset.asset_id if asset else 'asset'}",
+        resource_name=f"{document.document_type} for {asset.asset_id if asset else 'asset'}",
         user_id=user.id if user else 1,
         user_name=user.full_name if user else "User",
-        user_role=user.role.value if user else "user",
-        description=f"Document {document.document_type.value} signed by {user.full_name if user else 'user'}",
-        details=f"Asset: {asset.asset_id if asset else 'unknown'}, Document type: {document.document_type.value}",
+        user_role=user.role if user else "user",
+        description=f"Document {document.document_type} signed by {user.full_name if user else 'user'}",
+        details=f"Asset: {asset.asset_id if asset else 'unknown'}, Document type: {document.document_type}",
         asset_id=asset.id if asset else None,
         asset_identifier=asset.asset_id if asset else None
     )
     
     db.commit()
-    db.refresh(document)
+    invalidate_dashboard_cache()
     
     return DocumentResponse(
         id=document.id,
-        document_type=document.document_type.value,
-        status=document.status.value,
+        document_type=document.document_type,
+        status=document.status,
         created_at=document.created_at,
         signed_at=document.signed_at
     )
@@ -980,12 +1080,12 @@ def cancel_issuance(
 ):
     """Cancel an asset issuance and revert asset to available status"""
     # Get the issuance
-    issuance = db.query(AssetIssuance).filter(AssetIssuance.id == issuance_id).first()
+    issuance = db.get(AssetIssuance, issuance_id)
     if not issuance:
         raise HTTPException(status_code=404, detail="Issuance not found")
     
     # Get the asset
-    asset = db.query(Asset).filter(Asset.id == issuance.asset_id).first()
+    asset = db.get(Asset, issuance.asset_id)
     if not asset:
         raise HTTPException(status_code=404, detail="Asset not found")
     
@@ -997,13 +1097,13 @@ def cancel_issuance(
         )
     
     # Get user for logging
-    user = db.query(User).filter(User.id == issuance.user_id).first()
+    user = db.get(User, issuance.user_id)
     
     # Revert asset status
     asset.status = AssetStatus.AVAILABLE
     asset.assigned_user_id = None
+    asset.assigned_user_name = None
     asset.department = "IT"  # Reset to IT department
-    asset.updated_at = datetime.utcnow()
     
     # Mark issuance as returned (cancelled)
     issuance.return_date = datetime.utcnow()
@@ -1030,7 +1130,7 @@ def cancel_issuance(
         resource_name=f"{asset.brand} {asset.model}",
         user_id=current_user.id,  # Use actual current user
         user_name=current_user.full_name,  # Use actual current user name
-        user_role=current_user.role.value,  # Use actual current user role
+        user_role=current_user.role,  # Use actual current user role
         description=f"Issuance for {asset.asset_id} to {user.full_name if user else 'user'} was cancelled",
         details=f"Reason: {cancel_request.reason}",
         asset_id=asset.id,
@@ -1038,6 +1138,7 @@ def cancel_issuance(
     )
     
     db.commit()
+    invalidate_dashboard_cache()
     
     return {"message": "Issuance cancelled successfully", "asset_id": asset.asset_id}
 
@@ -1045,76 +1146,69 @@ def cancel_issuance(
 @router.get("/export/csv")
 def export_assets_csv(
     status: Optional[str] = Query(None),
-    department: Optional[str] = Query(None),
-    db: Session = Depends(get_db)
+    department: Optional[str] = Query(None)
 ):
     """Export assets to CSV"""
-    query = db.query(Asset)
+    # Only the exported columns are selected, in CSV order and already
+    # formatted by PostgreSQL, so rows are written to the CSV as they come back
+    stmt = select(
+        Asset.asset_id, Asset.type, Asset.brand, Asset.model,
+        func.coalesce(Asset.serial_number, ""),
+        Asset.department,
+        func.coalesce(Asset.location, ""),
+        Asset.status,
+        func.coalesce(Asset.assigned_user_name, ""),
+        func.to_char(Asset.purchase_date, "YYYY-MM-DD"),
+        func.to_char(Asset.warranty_expiry, "YYYY-MM-DD"),
+        func.coalesce(cast(func.nullif(Asset.purchase_cost, 0), String), ""),
+        Asset.condition,
+        func.coalesce(Asset.notes, ""),
+        func.to_char(Asset.created_at, "YYYY-MM-DD HH24:MI:SS")
+    )
     
     if status and status.strip():
         try:
             status_enum = AssetStatus(status.strip())
-            query = query.filter(Asset.status == status_enum)
+            stmt = stmt.where(Asset.status == status_enum)
         except ValueError:
             # Invalid status value, ignore the filter
             pass
     if department and department.strip():
-        query = query.filter(Asset.department == department.strip())
-    
-    assets = query.all()
-    
-    # Create CSV
-    output = io.StringIO()
-    writer = csv.writer(output)
+        stmt = stmt.where(Asset.department == department.strip())
     
-    # Write header
-    writer.writerow([
-        'Asset ID', 'Type', 'Brand', 'Model', 'Serial Number',
-        'Department', 'Location', 'Status', 'Assigned User',
-        'Purchase Date', 'Warranty Expiry', 'Purchase Cost',
-        'Condition', 'Notes', 'Created At'
-    ])
-    
-    # Write data
-    for asset in assets:
-        assigned_user = ""
-        if asset.assigned_user_id:
-            user = db.query(User).filter(User.id == asset.assigned_user_id).first()
-            assigned_user = user.full_name if user else ""
-        
-        writer.writerow([
-            asset.asset_id,
-            asset.type,
-            asset.brand,
-            asset.model,
-            asset.serial_number or "",
-            asset.department,
-            asset.location or "",
-            asset.status.value,
-            assigned_user,
-            asset.purchase_date.strftime("%Y-%m-%d"),
-            asset.warranty_expiry.strftime("%Y-%m-%d"),
-            asset.purchase_cost or "",
-            asset.condition,
-            asset.notes or "",
-            asset.created_at.strftime("%Y-%m-%d %H:%M:%S")
-        ])
-    
-    # Create response
-    output.seek(0)
-    response = Response(
-        content=output.getvalue(),
+    # Rows are streamed to the client as they are read, a batch at a time,
+    # so memory stays flat and the download starts immediately
+    return StreamingResponse(
+        _stream_assets_csv(stmt),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=assets.csv"}
     )
+
+def _stream_assets_csv(stmt):
+    """Yield the CSV export in chunks of EXPORT_BATCH_SIZE assets"""
+    output = io.StringIO()
+    output.write(EXPORT_CSV_HEADER)
+    writer = csv.writer(output)
     
-    return response
+    # The response outlives the request's session, so the export reads
+    # through its own session and a server-side cursor
+    with SessionLocal() as db:
+        result = db.execute(stmt, execution_options={"yield_per": EXPORT_BATCH_SIZE})
+        for batch in result.partitions():
+            writer.writerows(batch)
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate()
+    
+    # Header only when there are no assets
+    if output.tell():
+        yield output.getvalue()
 
 # Get asset history
 @router.get("/{asset_id}/history", response_model=List[AssetIssuanceResponse])
 def get_asset_history(asset_id: int, db: Session = Depends(get_db)):
     """Get asset issuance history"""
-    asset = db.query(Asset).filter(Asset.id == asset_id).first()
+    asset = db.get(Asset, asset_id)
     if asset is None:
         raise HTTPException(status_code=404, detail="Asset not found")
     
@@ -1124,21 +1218,43 @@ def get_asset_history(asset_id: int, db: Session = Depends(get_db)):
         AssetIssuance.issued_date.desc()
     ).all()
     
-    result = []
-    for issuance, user_name in issuances:
-        result.append(AssetIssuanceResponse(
-            id=issuance.id,
-            asset_id=issuance.asset_id,
-            user_id=issuance.user_id,
-            user_name=user_name,
-            issued_date=issuance.issued_date,
-            expected_return_date=issuance.expected_return_date,
-            return_date=issuance.return_date,
-            notes=issuance.notes,
-            issued_by=issuance.issued_by
-        ))
+    return _issuance_responses(issuances)
+
+def _insert_servers(db: Session, pending: List[Tuple[int, Dict[str, Any]]], next_number: int,
+                    errors: List[str]) -> Tuple[int, int]:
+    """
+    Insert a batch of imported servers as (row number, column values) pairs.
     
-    return result
+    The batch is sent as one executemany INSERT. If it breaks a unique
+    constraint, it is retried row by row, each row in its own savepoint: a
+    server whose SRV number was taken in the meantime is renumbered, and any
+    other conflict is reported as an error for that row.
+    
+    Returns the number of servers inserted and the next free SRV number.
+    """
+    try:
+        with db.begin_nested():
+            db.execute(insert(Asset), [values for _, values in pending])
+        return len(pending), next_number
+    except IntegrityError:
+        pass
+    
+    inserted = 0
+    for row_num, values in pending:
+        while True:
+            try:
+                with db.begin_nested():
+                    db.execute(insert(Asset), [values])
+            except IntegrityError as e:
+                if _violates(e, ASSET_ID_UNIQUE_INDEX):
+                    values["asset_id"] = f"SRV-{next_number:03d}"
+                    next_number += 1
+                    continue
+                errors.append(f"Row {row_num}: {e.orig}".strip())
+            else:
+                inserted += 1
+            break
+    return inserted, next_number
 
 @router.post("/import/servers")
 def import_servers_csv(
@@ -1151,14 +1267,28 @@ def import_servers_csv(
         if not file.filename.endswith('.csv'):
             raise HTTPException(status_code=400, detail="File must be a CSV file")
         
-        # Read and parse CSV content
-        csv_content = file.file.read().decode('utf-8')
-        csv_reader = csv.DictReader(io.StringIO(csv_content))
+        # Parse the CSV as it is read from the upload, decoding on the fly,
+        # instead of holding the whole file (and a decoded copy) in memory
+        csv_reader = csv.DictReader(io.TextIOWrapper(file.file, encoding='utf-8', newline=''))
         
         imported_count = 0
         skipped_count = 0
         errors = []
         
+        # Existing asset tags, server names and the highest SRV number are
+        # read once up front; the loop then checks duplicates against these
+        # sets and numbers new servers from a local counter
+        existing_tags = set(db.scalars(select(Asset.asset_tag).where(Asset.asset_tag.isnot(None))))
+        existing_server_names = set(db.scalars(
+            select(func.split_part(func.substr(Asset.notes, len("Server: ") + 1), " | ", 1))
+            .where(Asset.type == "server", Asset.notes.like("Server: %"))
+        ))
+        next_number = (db.scalar(
+            select(func.max(cast(func.substr(Asset.asset_id, len("SRV-") + 1), Integer)))
+            .where(Asset.asset_id.regexp_match("^SRV-[0-9]+$"))
+        ) or 0) + 1
+        pending = []
+        
         for row_num, row in enumerate(csv_reader, start=2):  # Start at 2 because row 1 is headers
             try:
                 # Skip empty rows
@@ -1188,35 +1318,16 @@ def import_servers_csv(
                     continue
                 
                 # Check for duplicate asset tag first (if provided)
-                if asset_tag:
-                    existing_asset_tag = db.query(Asset).filter(Asset.asset_tag == asset_tag).first()
-                    if existing_asset_tag:
-                        errors.append(f"Row {row_num}: Asset tag '{asset_tag}' already exists in database")
-                        skipped_count += 1
-                        continue
+                if asset_tag and asset_tag in existing_tags:
+                    errors.append(f"Row {row_num}: Asset tag '{asset_tag}' already exists in database")
+                    skipped_count += 1
+                    continue
                 
                 # Check for potential duplicate based on server name in notes (more specific)
-                if server_name:
-                    notes_pattern = f"Server: {server_name}%"
-                    existing_similar = db.query(Asset).filter(
-                        Asset.type == "server",
-                        Asset.notes.like(notes_pattern)
-                    ).first()
-                    if existing_similar:
-                        errors.append(f"Row {row_num}: Server with name '{server_name}' already exists")
-                        skipped_count += 1
-                        continue
-                
-                # Generate unique asset_id for server
-                existing_ids = db.query(Asset.asset_id).filter(Asset.asset_id.like('SRV-%')).all()
-                existing_numbers = [int(aid[0].split('-')[1]) for aid in existing_ids if aid[0].split('-')[1].isdigit()]
-                next_number = max(existing_numbers) + 1 if existing_numbers else 1
-                asset_id = f"SRV-{next_number:03d}"
-                
-                # Double-check for asset_id uniqueness
-                while db.query(Asset).filter(Asset.asset_id == asset_id).first():
-                    next_number += 1
-                    asset_id = f"SRV-{next_number:03d}"
+                if server_name and server_name in existing_server_names:
+                    errors.append(f"Row {row_num}: Server with name '{server_name}' already exists")
+                    skipped_count += 1
+                    continue
                 
                 # Set default dates
                 purchase_date = datetime.strptime('2024-01-01', '%Y-%m-%d')
@@ -1225,9 +1336,9 @@ def import_servers_csv(
                 # Extract brand from model (first word)
                 brand = model.split(' ')[0] if model else 'Generic'
                 
-                # Create server asset
-                server_asset = Asset(
-                    asset_id=asset_id,
+                # Queue the server asset; rows are inserted IMPORT_BATCH_SIZE at a time
+                pending.append((row_num, dict(
+                    asset_id=f"SRV-{next_number:03d}",
                     type="server",
                     brand=brand,
                     model=model,
@@ -1243,18 +1354,30 @@ def import_servers_csv(
                     os_version=os_version or None,  # Store OS version in separate field
                     notes=f"Server: {server_name} | Description: {server_description} | Asset Checked: {'Yes' if asset_checked else 'No'} | Remark: {remark}".strip(),
                     status=AssetStatus.AVAILABLE
-                )
+                )))
+                next_number += 1
                 
-                db.add(server_asset)
-                db.flush()  # Flush to get any DB errors early
-                imported_count += 1
+                if asset_tag:
+                    existing_tags.add(asset_tag)
+                if server_name:
+                    existing_server_names.add(server_name)
                 
             except Exception as e:
                 errors.append(f"Row {row_num}: {str(e)}")
                 continue
+            
+            if len(pending) >= IMPORT_BATCH_SIZE:
+                inserted, next_number = _insert_servers(db, pending, next_number, errors)
+                imported_count += inserted
+                pending.clear()
+        
+        if pending:
+            inserted, next_number = _insert_servers(db, pending, next_number, errors)
+            imported_count += inserted
         
         if imported_count > 0:
             db.commit()
+            invalidate_dashboard_cache()
         else:
             db.rollback()
         
@@ -1279,7 +1402,7 @@ def get_servers(
     db: Session = Depends(get_db)
 ):
     """Get all server assets"""
-    query = db.query(Asset).filter(Asset.type == "server")
+    query = db.query(*ASSET_RESPONSE_COLUMNS).filter(Asset.type == "server")
     
     # Apply filters
     if status:
@@ -1299,16 +1422,7 @@ def get_servers(
     
     # Get servers with user information
     servers = query.offset(skip).limit(limit).all()
-    
-    result = []
-    for server in servers:
-        server_response = AssetResponse.from_orm(server)
-        if server.assigned_user_id:
-            user = db.query(User).filter(User.id == server.assigned_user_id).first()
-            server_response.assigned_user_name = user.full_name if user else None
-        result.append(server_response)
-    
-    return result
+    return _asset_responses(servers)
 
 @router.get("/list/network-appliances", response_model=List[AssetResponse])
 def get_network_appliances(
@@ -1321,7 +1435,7 @@ def get_network_appliances(
     db: Session = Depends(get_db)
 ):
     """Get all network appliance assets (router, firewall, switch)"""
-    query = db.query(Asset).filter(Asset.type.in_(["router", "firewall", "switch"]))
+    query = db.query(*ASSET_RESPONSE_COLUMNS).filter(Asset.type.in_(["router", "firewall", "switch"]))
     
     # Apply filters
     if status:
@@ -1343,13 +1457,7 @@ def get_network_appliances(
     
     # Get network appliances
     appliances = query.offset(skip).limit(limit).all()
-    
-    result = []
-    for appliance in appliances:
-        appliance_response = AssetResponse.from_orm(appliance)
-        result.append(appliance_response)
-    
-    return result
+    return _asset_responses(appliances)
 
 @router.delete("/network-appliances/all")
 def delete_all_network_appliances(db: Session = Depends(get_db)):
@@ -1358,6 +1466,7 @@ def delete_all_network_appliances(db: Session = Depends(get_db)):
         # Delete all network appliances
         deleted_count = db.query(Asset).filter(Asset.type.in_(["router", "firewall", "switch"])).delete()
         db.commit()
+        invalidate_dashboard_cache()
         
         return {
             "message": f"Successfully deleted {deleted_count} network appliances",
@@ -1374,6 +1483,7 @@ def delete_all_servers(db: Session = Depends(get_db)):
         # Delete all servers
         deleted_count = db.query(Asset).filter(Asset.type == "server").delete()
         db.commit()
+        invalidate_dashboard_cache()
         
         return {
             "message": f"Successfully deleted {deleted_count} servers",
@@ -1423,9 +1533,9 @@ def import_network_appliances_csv(
         if not file.filename.endswith('.csv'):
             raise HTTPException(status_code=400, detail="File must be a CSV file")
         
-        # Read and parse CSV content
-        csv_content = file.file.read().decode('utf-8')
-        csv_reader = csv.DictReader(io.StringIO(csv_content))
+        # Parse the CSV as it is read from the upload, decoding on the fly,
+        # instead of holding the whole file (and a decoded copy) in memory
+        csv_reader = csv.DictReader(io.TextIOWrapper(file.file, encoding='utf-8', newline=''))
         
         imported_count = 0
         skipped_count = 0
@@ -1452,16 +1562,14 @@ def import_network_appliances_csv(
                 
                 # PRIMARY DUPLICATE CHECK: Asset Tag (Finance Department's unique identifier)
                 if asset_tag:
-                    existing_asset_tag = db.query(Asset).filter(Asset.asset_tag == asset_tag).first()
-                    if existing_asset_tag:
+                    if db.query(db.query(Asset.id).filter(Asset.asset_tag == asset_tag).exists()).scalar():
                         errors.append(f"Row {row_num}: Asset tag '{asset_tag}' already exists in database")
                         skipped_count += 1
                         continue
                 
                 # SECONDARY DUPLICATE CHECK: Serial number (for items without asset tags)
                 if serial_number:
-                    existing_serial = db.query(Asset).filter(Asset.serial_number == serial_number).first()
-                    if existing_serial:
+                    if db.query(db.query(Asset.id).filter(Asset.serial_number == serial_number).exists()).scalar():
                         errors.append(f"Row {row_num}: Serial number '{serial_number}' already exists in database")
                         skipped_count += 1
                         continue
@@ -1476,7 +1584,7 @@ def import_network_appliances_csv(
                 asset_id = f"{prefix}-{next_number:03d}"
                 
                 # Double-check for asset_id uniqueness
-                while db.query(Asset).filter(Asset.asset_id == asset_id).first():
+                while db.scalar(ASSET_ID_TAKEN, {"asset_id": asset_id}) is not None:
                     next_number += 1
                     asset_id = f"{prefix}-{next_number:03d}"
                 
@@ -1539,7 +1647,7 @@ def import_network_appliances_csv(
                     location=location,
                     purchase_date=purchase_date,
                     warranty_expiry=warranty_expiry,
-                    purchase_cost=row.get('Purchase Cost (Optional)', '').strip() or None,
+                    purchase_cost=_parse_purchase_cost(row.get('Purchase Cost (Optional)', '')),
                     condition=row.get('Condition (Optional)', 'Good').strip(),
                     notes=notes,
                     status=AssetStatus.AVAILABLE
@@ -1555,6 +1663,7 @@ def import_network_appliances_csv(
         
         if imported_count > 0:
             db.commit()
+            invalidate_dashboard_cache()
         else:
             db.rollback()
         
@@ -7,8 +7,9 @@ import jwt
 from passlib.context import CryptContext
 
 from app.core.database import get_db
-from app.core.config import settings
+from app.core.config import Settings, get_settings, settings
 from app.models.models import User, UserRole
+from app.models.queries import USER_BY_USERNAME
 from pydantic import BaseModel
 
 router = APIRouter(
@@ -83,7 +84,7 @@ def get_current_user(
         )
     
     username = payload.get("sub")
-    user = db.query(User).filter(User.username == username).first()
+    user = db.scalars(USER_BY_USERNAME, {"username": username}).first()
     
     if user is None or not user.is_active:
         raise HTTPException(
@@ -125,9 +126,13 @@ def require_manager_or_admin(current_user: User = Depends(get_current_user)):
 
 # Routes
 @router.post("/login", response_model=TokenResponse)
-def login(login_request: LoginRequest, db: Session = Depends(get_db)):
+def login(
+    login_request: LoginRequest,
+    db: Session = Depends(get_db),
+    settings: Settings = Depends(get_settings)
+):
     """Authenticate user and return access token"""
-    user = db.query(User).filter(User.username == login_request.username).first()
+    user = db.scalars(USER_BY_USERNAME, {"username": login_request.username}).first()
     
     if not user or not verify_password(login_request.password, user.hashed_password):
         raise HTTPException(
@@ -145,7 +150,7 @@ def login(login_request: LoginRequest, db: Session = Depends(get_db)):
     
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.username, "user_id": user.id, "role": user.role.value},
+        data={"sub": user.username, "user_id": user.id, "role": user.role},
         expires_delta=access_token_expires
     )
     
@@ -155,7 +160,7 @@ def login(login_request: LoginRequest, db: Session = Depends(get_db)):
         expires_in=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
         user_id=user.id,
         username=user.username,
-        role=user.role.value
+        role=user.role
     )
 
 @router.get("/me", response_model=UserInfo)
@@ -177,11 +182,14 @@ def logout():
     return {"message": "Successfully logged out"}
 
 @router.post("/refresh", response_model=TokenResponse)
-def refresh_token(current_user: User = Depends(get_current_user)):
+def refresh_token(
+    current_user: User = Depends(get_current_user),
+    settings: Settings = Depends(get_settings)
+):
     """Refresh access token"""
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": current_user.username, "user_id": current_user.id, "role": current_user.role.value},
+        data={"sub": current_user.username, "user_id": current_user.id, "role": current_user.role},
         expires_delta=access_token_expires
     )
     
@@ -191,5 +199,5 @@ def refresh_token(current_user: User = Depends(get_current_user)):
         expires_in=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
         user_id=current_user.id,
         username=current_user.username,
-        role=current_user.role.value
+        role=current_user.role
     ) 
\ No newline at end of file
@@ -1,8 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime, timedelta
-import json
 import base64
 
 from ..core.database import get_db
@@ -12,6 +11,38 @@ from pydantic import BaseModel
 
 router = APIRouter(prefix="/documents", tags=["documents"])
 
+def decode_signature(signature: str) -> bytes:
+    """
+    Decode a Base64 signature into the raw image bytes that are stored.
+    
+    Accepts either a data URL ("data:image/png;base64,...") as produced by the
+    signature canvas, or bare Base64.
+    """
+    _, _, encoded = signature.rpartition(",")
+    try:
+        return base64.b64decode(encoded, validate=True)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid signature data")
+
+def load_document_templates(db: Session) -> Dict[DocumentType, DocumentTemplate]:
+    """Load every document template keyed by document type"""
+    return {t.document_type: t for t in db.query(DocumentTemplate).all()}
+
+def get_document_template_cache(
+    request: Request,
+    db: Session = Depends(get_db)
+) -> Dict[DocumentType, DocumentTemplate]:
+    """
+    Dependency returning the process-wide template cache.
+    
+    Templates are preloaded once in the application lifespan. If they were
+    initialized after startup the cache is empty, so it is filled on first use.
+    """
+    templates = getattr(request.app.state, "templates", None)
+    if not templates:
+        templates = request.app.state.templates = load_document_templates(db)
+    return templates
+
 # Pydantic models for request/response
 class DocumentSignRequest(BaseModel):
     asset_id: int
@@ -31,41 +62,40 @@ class DocumentTemplateResponse(BaseModel):
     id: int
     document_type: str
     template_name: str
-    fields_schema: dict
+    fields_schema: List[dict]
 
 @router.get("/templates", response_model=List[DocumentTemplateResponse])
-async def get_document_templates(db: Session = Depends(get_db)):
+async def get_document_templates(
+    template_cache: Dict[DocumentType, DocumentTemplate] = Depends(get_document_template_cache)
+):
     """Get all active document templates"""
-    templates = db.query(DocumentTemplate).filter(DocumentTemplate.is_active == True).all()
+    templates = [t for t in template_cache.values() if t.is_active]
     return [
         DocumentTemplateResponse(
             id=template.id,
-            document_type=template.document_type.value,
+            document_type=template.document_type,
             template_name=template.template_name,
-            fields_schema=json.loads(template.fields_schema)
+            fields_schema=template.fields_schema
         ) for template in templates
     ]
 
 @router.get("/templates/{document_type}")
 async def get_document_template(
     document_type: str,
-    db: Session = Depends(get_db)
+    template_cache: Dict[DocumentType, DocumentTemplate] = Depends(get_document_template_cache)
 ):
     """Get specific document template with HTML content"""
-    template = db.query(DocumentTemplate).filter(
-        DocumentTemplate.document_type == DocumentType(document_type),
-        DocumentTemplate.is_active == True
-    ).first()
+    template = template_cache.get(DocumentType(document_type))
     
-    if not template:
+    if not template or not template.is_active:
         raise HTTPException(status_code=404, detail="Template not found")
     
     return {
         "id": template.id,
-        "document_type": template.document_type.value,
+        "document_type": template.document_type,
         "template_name": template.template_name,
         "template_content": template.template_content,
-        "fields_schema": json.loads(template.fields_schema),
+        "fields_schema": template.fields_schema,
         "version": template.version
     }
 
@@ -79,19 +109,21 @@ async def sign_document(
     """Sign an electronic document"""
     
     # Verify asset exists and user has access
-    asset = db.query(Asset).filter(Asset.id == request.asset_id).first()
+    asset = db.get(Asset, request.asset_id)
     if not asset:
         raise HTTPException(status_code=404, detail="Asset not found")
     
     # Check if document already exists and is signed
-    existing_doc = db.query(AssetDocument).filter(
-        AssetDocument.asset_id == request.asset_id,
-        AssetDocument.user_id == current_user.id,
-        AssetDocument.document_type == DocumentType(request.document_type),
-        AssetDocument.status == DocumentStatus.SIGNED
-    ).first()
+    already_signed = db.query(
+        db.query(AssetDocument.id).filter(
+            AssetDocument.asset_id == request.asset_id,
+            AssetDocument.user_id == current_user.id,
+            AssetDocument.document_type == DocumentType(request.document_type),
+            AssetDocument.status == DocumentStatus.SIGNED
+        ).exists()
+    ).scalar()
     
-    if existing_doc:
+    if already_signed:
         raise HTTPException(status_code=400, detail="Document already signed")
     
     # Create new document record
@@ -100,8 +132,8 @@ async def sign_document(
         user_id=current_user.id,
         document_type=DocumentType(request.document_type),
         status=DocumentStatus.SIGNED,
-        document_data=json.dumps(request.form_data),
-        signature_data=request.signature,
+        document_data=request.form_data,
+        signature_data=decode_signature(request.signature),
         ip_address=http_request.client.host,
         user_agent=http_request.headers.get("user-agent", ""),
         signed_at=datetime.utcnow(),
@@ -110,7 +142,6 @@ async def sign_document(
     
     db.add(document)
     db.commit()
-    db.refresh(document)
     
     return {
         "message": "Document signed successfully",
@@ -133,8 +164,8 @@ async def get_asset_documents(
         DocumentResponse(
             id=doc.id,
             asset_id=doc.asset_id,
-            document_type=doc.document_type.value,
-            status=doc.status.value,
+            document_type=doc.document_type,
+            status=doc.status,
             created_at=doc.created_at,
             signed_at=doc.signed_at
         ) for doc in documents
@@ -155,7 +186,7 @@ async def get_pending_documents(
         {
             "id": doc.id,
             "asset_id": doc.asset_id,
-            "document_type": doc.document_type.value,
+            "document_type": doc.document_type,
             "created_at": doc.created_at,
             "expires_at": doc.expires_at
         } for doc in pending_docs
@@ -165,7 +196,8 @@ async def get_pending_documents(
 async def get_user_documents(
     user_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    templates: Dict[DocumentType, DocumentTemplate] = Depends(get_document_template_cache)
 ):
     """Get all documents for a specific user with template information"""
     # Users can only see their own documents, admins/managers can see any
@@ -176,19 +208,16 @@ async def get_user_documents(
         AssetDocument.user_id == user_id
     ).all()
     
-    # Get template information for document names
-    templates = {t.document_type: t for t in db.query(DocumentTemplate).all()}
-    
     return [
         {
             "id": doc.id,
             "asset_id": doc.asset_id,
-            "document_type": doc.document_type.value,
-            "status": doc.status.value,
+            "document_type": doc.document_type,
+            "status": doc.status,
             "created_at": doc.created_at,
             "signed_at": doc.signed_at,
             "expires_at": doc.expires_at,
-            "template_name": templates.get(doc.document_type, {}).template_name if templates.get(doc.document_type) else f"Document {doc.document_type.value}"
+            "template_name": templates.get(doc.document_type, {}).template_name if templates.get(doc.document_type) else f"Document {doc.document_type}"
         } for doc in documents
     ]
 
@@ -207,7 +236,7 @@ async def initiate_document_signing(
         raise HTTPException(status_code=403, detail="Insufficient permissions")
     
     # Verify asset exists
-    asset = db.query(Asset).filter(Asset.id == asset_id).first()
+    asset = db.get(Asset, asset_id)
     if not asset:
         raise HTTPException(status_code=404, detail="Asset not found")
     
@@ -5,9 +5,10 @@ from datetime import datetime
 from passlib.context import CryptContext
 from fastapi.security import HTTPBearer
 
+from app.core.cache import invalidate_dashboard_cache
 from app.core.database import get_db
-from app.models.models import User, UserRole
-from pydantic import BaseModel, EmailStr
+from app.models.models import Asset, User, UserRole
+from pydantic import BaseModel, ConfigDict, EmailStr, TypeAdapter
 
 router = APIRouter(
     prefix="/users",
@@ -43,8 +44,10 @@ class UserResponse(UserBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+# Validates a whole page of users in one call, built once at import
+USER_LIST_ADAPTER = TypeAdapter(List[UserResponse])
 
 class PasswordUpdate(BaseModel):
     current_password: str
@@ -62,7 +65,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def create_user(user: UserCreate, db: Session = Depends(get_db)):
     """Create a new user"""
     # Check if username already exists
-    existing_user = db.query(User).filter(User.username == user.username).first()
+    existing_user = db.query(db.query(User.id).filter(User.username == user.username).exists()).scalar()
     if existing_user:
         raise HTTPException(
             status_code=400,
@@ -70,7 +73,7 @@ def create_user(user: UserCreate, db: Session = Depends(get_db)):
         )
     
     # Check if email already exists
-    existing_email = db.query(User).filter(User.email == user.email).first()
+    existing_email = db.query(db.query(User.id).filter(User.email == user.email).exists()).scalar()
     if existing_email:
         raise HTTPException(
             status_code=400,
@@ -87,9 +90,8 @@ def create_user(user: UserCreate, db: Session = Depends(get_db)):
     
     db.add(db_user)
     db.commit()
-    db.refresh(db_user)
     
-    return UserResponse.from_orm(db_user)
+    return UserResponse.model_validate(db_user)
 
 @router.get("/", response_model=List[UserResponse])
 def get_users(
@@ -111,27 +113,27 @@ def get_users(
         query = query.filter(User.is_active == is_active)
     
     users = query.offset(skip).limit(limit).all()
-    return [UserResponse.from_orm(user) for user in users]
+    return USER_LIST_ADAPTER.validate_python(users, from_attributes=True)
 
 @router.get("/{user_id}", response_model=UserResponse)
 def get_user(user_id: int, db: Session = Depends(get_db)):
     """Get a specific user by ID"""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
     
-    return UserResponse.from_orm(user)
+    return UserResponse.model_validate(user)
 
 @router.put("/{user_id}", response_model=UserResponse)
 def update_user(user_id: int, user_update: UserUpdate, db: Session = Depends(get_db)):
     """Update a user"""
-    db_user = db.query(User).filter(User.id == user_id).first()
+    db_user = db.get(User, user_id)
     if db_user is None:
         raise HTTPException(status_code=404, detail="User not found")
     
     # Check if username already exists (if being updated)
     if user_update.username and user_update.username != db_user.username:
-        existing_user = db.query(User).filter(User.username == user_update.username).first()
+        existing_user = db.query(db.query(User.id).filter(User.username == user_update.username).exists()).scalar()
         if existing_user:
             raise HTTPException(
                 status_code=400,
@@ -140,7 +142,7 @@ def update_user(user_id: int, user_update: UserUpdate, db: Session = Depends(get
     
     # Check if email already exists (if being updated)
     if user_update.email and user_update.email != db_user.email:
-        existing_email = db.query(User).filter(User.email == user_update.email).first()
+        existing_email = db.query(db.query(User.id).filter(User.email == user_update.email).exists()).scalar()
         if existing_email:
             raise HTTPException(
                 status_code=400,
@@ -151,22 +153,30 @@ def update_user(user_id: int, user_update: UserUpdate, db: Session = Depends(get
     for key, value in update_data.items():
         setattr(db_user, key, value)
     
-    db_user.updated_at = datetime.utcnow()
+    # Assets store a copy of their assigned user's name; keep it in step
+    renamed = "full_name" in update_data
+    if renamed:
+        db.query(Asset).filter(Asset.assigned_user_id == db_user.id).update(
+            # Bump the version too, so cached copies (ETags) of these assets expire
+            {Asset.assigned_user_name: db_user.full_name, Asset.version: Asset.version + 1},
+            synchronize_session=False
+        )
+    
     db.commit()
-    db.refresh(db_user)
+    if renamed:
+        invalidate_dashboard_cache()
     
-    return UserResponse.from_orm(db_user)
+    return UserResponse.model_validate(db_user)
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_user(user_id: int, db: Session = Depends(get_db)):
     """Delete a user (soft delete by setting is_active to False)"""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
     
     # Soft delete
     user.is_active = False
-    user.updated_at = datetime.utcnow()
     db.commit()
     return None
 
@@ -177,7 +187,7 @@ def update_password(
     db: Session = Depends(get_db)
 ):
     """Update user password"""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
     
@@ -190,7 +200,6 @@ def update_password(
     
     # Update password
     user.hashed_password = hash_password(password_update.new_password)
-    user.updated_at = datetime.utcnow()
     db.commit()
     
     return {"message": "Password updated successfully"}
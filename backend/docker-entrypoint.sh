@@ -0,0 +1,9 @@
+#!/bin/sh
+# Container entrypoint for the backend.
+# Applies database migrations once, before the server forks its workers,
+# then hands the process over to the command given to the container.
+set -e
+
+alembic upgrade head
+
+exec "$@"
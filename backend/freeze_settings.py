@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Settings freezing script for IT Asset Management System.
+
+This script builds the application settings from the current environment and
+.env file and writes them as JSON to FROZEN_SETTINGS_DIR (a directory outside
+the source tree, set with SETTINGS_CACHE_DIR). On startup get_settings() loads
+that artifact instead of parsing the environment again.
+
+Secret settings (SECRET_SETTINGS: the database URL, JWT secret and Redis URL)
+are never written; they are always read from the environment at startup.
+
+The artifact name is derived from the environment variables and the .env
+modification time (see frozen_settings_path()), so it is only picked up by
+processes started with the same configuration; anything else falls back to
+normal loading. Run it as part of the deploy step, with the same environment
+the application will run with.
+
+Usage:
+    python freeze_settings.py
+
+Make sure to run this from the backend directory so the same .env file is used.
+"""
+
+import json
+import os
+
+from app.core.config import FROZEN_SETTINGS_DIR, Settings, frozen_settings_path
+
+
+def freeze_settings() -> str:
+    """Write the current settings to the frozen artifact and return its path."""
+    os.makedirs(FROZEN_SETTINGS_DIR, exist_ok=True)
+    path = frozen_settings_path()
+    with open(path, "w", encoding="utf-8") as frozen:
+        json.dump(Settings._load()._frozen(), frozen)
+    return path
+
+
+if __name__ == "__main__":
+    print(f"Frozen settings written to {freeze_settings()}")